@@ -1,12 +1,38 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import json
 import os
+import hashlib
+import mmap
+import re
+import time
+try:
+    import orjson  # C-accelerated (de)serialization for the call database
+except ImportError:
+    orjson = None
+try:
+    import fcntl  # POSIX file locking for the record id counter
+except ImportError:
+    fcntl = None
 from datetime import datetime
-import openai
+from functools import lru_cache, partial
+from contextlib import contextmanager
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from il_params import (
+    CORE_GUIDE_ENTRIES, IL_GUIDE_ENTRIES, CALL_TYPE_FOCUS_BULLETS, CALL_TYPE_FOCUS_TOP5,
+    CALL_TYPES, CALL_TYPE_FILTER_OPTIONS, PITCH_OUTCOMES, OUTCOME_FILTER_OPTIONS,
+    CORE_WEIGHTS, IL_WEIGHTS, ALL_WEIGHTS, CORE_KEYS, IL_KEYS, ALL_KEYS, CORE_MAX, IL_MAX,
+    CORE_DEFAULTS, IL_DEFAULTS, _CORE_GET, _IL_GET, _pretty, _tier_emoji,
+)
 
 # Page configuration
 st.set_page_config(
@@ -16,7 +42,12 @@ st.set_page_config(
 )
 
 # Initialize OpenAI client
-openai.api_key = st.secrets.get("OPENAI_API_KEY", os.getenv("OPENAI_API_KEY"))
+@st.cache_resource
+def get_openai_client():
+    """One OpenAI client per process - its HTTP connection pool is reused across reruns and sessions"""
+    import openai  # deferred: ~0.7 s to import and only the analysis needs it, so other pages start without it
+    # max_retries=0 - retries are handled (with backoff) by _stream_gpt_analysis, which also covers mid-stream failures
+    return openai.OpenAI(api_key=st.secrets.get("OPENAI_API_KEY", os.getenv("OPENAI_API_KEY")), max_retries=0, timeout=GPT_REQUEST_TIMEOUT)
 
 # AWS S3 Functions
 def get_s3_client():
@@ -34,6 +65,27 @@ def get_s3_client():
 def get_bucket_name():
     return st.secrets.get("AWS_S3_BUCKET_NAME", os.getenv("AWS_S3_BUCKET_NAME"))
 
+@st.cache_resource
+def get_io_pool():
+    """Shared worker pool for background I/O (S3 uploads), reused across reruns"""
+    return ThreadPoolExecutor(max_workers=2)
+
+def submit_background(fn, *args, **kwargs):
+    """Run fn on the I/O pool, keeping the script context so st.* calls inside still render"""
+    ctx = get_script_run_ctx()
+    
+    def _run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args, **kwargs)
+    
+    return get_io_pool().submit(_run)
+
+# Accepted recording formats and the S3 Content-Type for each
+RECORDING_CONTENT_TYPES = {'.mp3': 'audio/mpeg', '.wav': 'audio/wav', '.m4a': 'audio/mp4', '.mp4': 'video/mp4'}
+RECORDING_TYPES = tuple(ext.lstrip('.') for ext in RECORDING_CONTENT_TYPES)
+# Recordings go to S3 in 8 MiB parts, at most 2 in flight - bounds the part buffers copied per upload to ~16 MiB
+S3_TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024, multipart_chunksize=8 * 1024 * 1024, max_concurrency=2)
+
 def upload_to_s3(file_obj, filename, metadata=None):
     """Upload file to S3"""
     s3_client = get_s3_client()
@@ -47,10 +99,8 @@ def upload_to_s3(file_obj, filename, metadata=None):
         s3_key = f"recordings/{date_path}/{filename}"
         
         ext = Path(filename).suffix.lower()
-        content_types = {'.mp3': 'audio/mpeg', '.wav': 'audio/wav', '.m4a': 'audio/mp4', '.mp4': 'video/mp4'}
-        
         extra_args = {
-            'ContentType': content_types.get(ext, 'application/octet-stream'),
+            'ContentType': RECORDING_CONTENT_TYPES.get(ext, 'application/octet-stream'),
             'ServerSideEncryption': 'AES256'
         }
         
@@ -58,7 +108,7 @@ def upload_to_s3(file_obj, filename, metadata=None):
             extra_args['Metadata'] = {k: str(v) for k, v in metadata.items()}
         
         file_obj.seek(0)
-        s3_client.upload_fileobj(file_obj, bucket_name, s3_key, ExtraArgs=extra_args)
+        s3_client.upload_fileobj(file_obj, bucket_name, s3_key, ExtraArgs=extra_args, Config=S3_TRANSFER_CONFIG)
         
         return f"s3://{bucket_name}/{s3_key}"
     except Exception as e:
@@ -164,8 +214,7 @@ def download_s3_analysis(s3_key):
     try:
         # Download JSON from S3
         file_obj = s3_client.get_object(Bucket=bucket_name, Key=s3_key)
-        content = file_obj['Body'].read().decode('utf-8')
-        analysis_data = json.loads(content)
+        analysis_data = _parse_json(file_obj['Body'].read())
         return analysis_data
     except Exception as e:
         st.error(f"Error downloading analysis: {str(e)}")
@@ -212,8 +261,7 @@ def get_s3_analysis(record_id, rm_name, call_date):
             if f"analysis_{record_id}_" in key or (rm_name.replace(' ', '_') in key and call_date in key):
                 # Download and parse JSON
                 file_obj = s3_client.get_object(Bucket=bucket_name, Key=key)
-                content = file_obj['Body'].read().decode('utf-8')
-                return json.loads(content)
+                return _parse_json(file_obj['Body'].read())
         
         return None
     except Exception as e:
@@ -296,12 +344,10 @@ def upload_analysis_to_s3(record):
         # Store under 'recordings/' prefix so same lifecycle policy applies
         analysis_key = f"recordings/analysis/{date_path}/analysis_{record['id']}_{record['rm_name'].replace(' ', '_')}_{record['call_date']}.json"
         
-        analysis_json = json.dumps(record, indent=2)
-        
         s3_client.put_object(
             Bucket=bucket_name,
             Key=analysis_key,
-            Body=analysis_json.encode('utf-8'),
+            Body=_dumps(record),
             ContentType='application/json',
             ServerSideEncryption='AES256',
             Metadata={
@@ -321,6 +367,8 @@ def upload_analysis_to_s3(record):
 def generate_summary_report(record):
     """Generate downloadable summary with improvements and areas needing focus"""
     analysis = record.get('analysis', {})
+    insights = analysis.get('key_insights', {})
+    pred = analysis.get('outcome_prediction', {})
     
     report = f"""
 ╔══════════════════════════════════════════════════════════════════╗
@@ -348,12 +396,11 @@ Call Effectiveness:      {analysis.get('call_effectiveness', 'N/A')}
 """
     
     core_dims = analysis.get('core_dimensions', {})
-    weights = {"rapport_building": 20, "needs_discovery": 25, "solution_presentation": 25, "objection_handling": 15, "closing_technique": 15}
     for dim, score in core_dims.items():
-        max_score = weights.get(dim, 10)
+        max_score = CORE_WEIGHTS.get(dim, 10)
         pct = (score / max_score) * 100
         status = "✓" if pct >= 70 else "⚠" if pct >= 50 else "✗"
-        report += f"{status} {dim.replace('_', ' ').title():<25} {score:>2}/{max_score:<2} ({pct:>3.0f}%)\n"
+        report += f"{status} {_pretty(dim):<25} {score:>2}/{max_score:<2} ({pct:>3.0f}%)\n"
     
     report += f"""
 💎 IRON LADY SPECIFIC PARAMETERS (Sorted by Performance)
@@ -372,7 +419,7 @@ Call Effectiveness:      {analysis.get('call_effectiveness', 'N/A')}
             status = "🟡 Good    "
         else:
             status = "🔴 Needs Focus"
-        report += f"{status}  {param.replace('_', ' ').title():<25} {score:>2}/10 ({pct:>3.0f}%)\n"
+        report += f"{status}  {_pretty(param):<25} {score:>2}/10 ({pct:>3.0f}%)\n"
     
     report += f"""
 📊 PERFORMANCE BREAKDOWN BY CATEGORY
@@ -380,7 +427,7 @@ Call Effectiveness:      {analysis.get('call_effectiveness', 'N/A')}
 
 🟢 EXCELLENT (80%+):
 """
-    excellent = [f"   • {p.replace('_', ' ').title()} - {s}/10 ({(s/10*100):.0f}%)" 
+    excellent = [f"   • {_pretty(p)} - {s}/10 ({(s/10*100):.0f}%)" 
                  for p, s in sorted_params if (s/10*100) >= 80]
     if excellent:
         report += "\n".join(excellent) + "\n"
@@ -390,7 +437,7 @@ Call Effectiveness:      {analysis.get('call_effectiveness', 'N/A')}
     report += f"""
 🟡 GOOD (60-79%):
 """
-    good = [f"   • {p.replace('_', ' ').title()} - {s}/10 ({(s/10*100):.0f}%)" 
+    good = [f"   • {_pretty(p)} - {s}/10 ({(s/10*100):.0f}%)" 
             for p, s in sorted_params if 60 <= (s/10*100) < 80]
     if good:
         report += "\n".join(good) + "\n"
@@ -400,7 +447,7 @@ Call Effectiveness:      {analysis.get('call_effectiveness', 'N/A')}
     report += f"""
 🔴 NEEDS IMMEDIATE FOCUS (<60%):
 """
-    needs_focus = [f"   • {p.replace('_', ' ').title()} - {s}/10 ({(s/10*100):.0f}%) ⚠️ PRIORITY" 
+    needs_focus = [f"   • {_pretty(p)} - {s}/10 ({(s/10*100):.0f}%) ⚠️ PRIORITY" 
                    for p, s in sorted_params if (s/10*100) < 60]
     if needs_focus:
         report += "\n".join(needs_focus) + "\n"
@@ -411,21 +458,21 @@ Call Effectiveness:      {analysis.get('call_effectiveness', 'N/A')}
 ✅ KEY STRENGTHS
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
-    for i, s in enumerate(analysis.get('key_insights', {}).get('strengths', []), 1):
+    for i, s in enumerate(insights.get('strengths', []), 1):
         report += f"{i}. {s}\n"
     
     report += f"""
 🔴 CRITICAL IMPROVEMENT AREAS (TOP PRIORITY)
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
-    for i, g in enumerate(analysis.get('key_insights', {}).get('critical_gaps', []), 1):
+    for i, g in enumerate(insights.get('critical_gaps', []), 1):
         report += f"{i}. ⚠️  {g}\n"
     
     report += f"""
 ⚠️ MISSED OPPORTUNITIES
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
-    for i, o in enumerate(analysis.get('key_insights', {}).get('missed_opportunities', []), 1):
+    for i, o in enumerate(insights.get('missed_opportunities', []), 1):
         report += f"{i}. {o}\n"
     
     report += f"""
@@ -450,7 +497,7 @@ Call Effectiveness:      {analysis.get('call_effectiveness', 'N/A')}
     action_items = []
     for param, score in sorted_params[-3:]:  # Bottom 3 parameters
         if score < 7:
-            param_name = param.replace('_', ' ').title()
+            param_name = _pretty(param)
             if 'principles' in param:
                 action_items.append(f"• PRACTICE: Memorize and use 27 Principles by name in every call")
             elif 'case_studies' in param:
@@ -470,9 +517,9 @@ Call Effectiveness:      {analysis.get('call_effectiveness', 'N/A')}
     report += f"""
 🔮 OUTCOME PREDICTION
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Prediction:    {analysis.get('outcome_prediction', {}).get('likely_result', 'N/A').replace('_', ' ').title()}
-Confidence:    {analysis.get('outcome_prediction', {}).get('confidence', 0)}%
-Reasoning:     {analysis.get('outcome_prediction', {}).get('reasoning', 'N/A')}
+Prediction:    {_pretty(pred.get('likely_result', 'N/A'))}
+Confidence:    {pred.get('confidence', 0)}%
+Reasoning:     {pred.get('reasoning', 'N/A')}
 
 📝 EXECUTIVE SUMMARY
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -488,40 +535,17 @@ All S3 Storage: Auto-deletes after 7 days (Recordings + Analysis JSON)
 
 # Create data directory (database only, not uploads)
 DATA_DIR = Path("data")
+# Every rerun - a single cheap syscall, and it recreates the directory if a container reset removed it mid-session
 DATA_DIR.mkdir(exist_ok=True)
-DB_FILE = DATA_DIR / "calls_database.json"
-
-# Iron Lady Parameters
-IRON_LADY_PARAMETERS = {
-    "Core Quality Dimensions": {
-        "rapport_building": {"weight": 20, "description": "Greetings, warmth, empathy, personalization, relatedness"},
-        "needs_discovery": {"weight": 25, "description": "Strategic questions, probing, understanding challenges and BHAG"},
-        "solution_presentation": {"weight": 25, "description": "Program benefits, community value, outcomes, social proof"},
-        "objection_handling": {"weight": 15, "description": "Concern handling with empathy and solutions"},
-        "closing_technique": {"weight": 15, "description": "Powerful invite, next steps, commitment getting"}
-    },
-    "Iron Lady Specific Parameters": {
-        "profile_understanding": {"weight": 10, "description": "Understanding experience, role, challenges, goals"},
-        "credibility_building": {"weight": 10, "description": "Iron Lady community, success stories, mentors, certification"},
-        "principles_usage": {"weight": 10, "description": "27 Principles framework (Unpredictable Behaviour, 10000 Hours, Differentiate Branding, Shameless Pitching, Art of Negotiation, Contextualisation)"},
-        "case_studies_usage": {"weight": 10, "description": "Success stories from participants (Neha, Rashmi, Chandana, Annapurna, Pushpalatha, Tejaswini)"},
-        "gap_creation": {"weight": 10, "description": "Highlighting what's missing to achieve BHAG, creating urgency"},
-        "bhag_fine_tuning": {"weight": 10, "description": "Big Hairy Audacious Goal exploration, making them dream bigger"},
-        "urgency_creation": {"weight": 10, "description": "Limited spots, immediate action, cost of inaction"},
-        "commitment_getting": {"weight": 10, "description": "Explicit commitments for attendance, participation, taking calls"},
-        "contextualisation": {"weight": 10, "description": "Personalizing to participant's specific situation and profile"},
-        "excitement_creation": {"weight": 10, "description": "Creating enthusiasm about transformation journey"}
-    }
-}
-
-CALL_TYPE_FOCUS = {
-    "Welcome Call": ["rapport_building", "profile_understanding", "credibility_building", "principles_usage", "case_studies_usage", "gap_creation", "bhag_fine_tuning", "commitment_getting", "urgency_creation", "contextualisation", "excitement_creation"],
-    "BHAG Call": ["bhag_fine_tuning", "gap_creation", "case_studies_usage", "commitment_getting", "principles_usage", "urgency_creation", "closing_technique"],
-    "Registration Call": ["urgency_creation", "objection_handling", "commitment_getting", "solution_presentation", "credibility_building", "closing_technique"],
-    "30 Sec Pitch": ["profile_understanding", "gap_creation", "case_studies_usage", "urgency_creation", "commitment_getting", "excitement_creation"],
-    "Second Level Call": ["credibility_building", "objection_handling", "solution_presentation", "case_studies_usage", "commitment_getting"],
-    "Follow Up Call": ["commitment_getting", "objection_handling", "urgency_creation", "case_studies_usage", "closing_technique"]
-}
+DB_FILE = DATA_DIR / "calls_database.jsonl"  # one JSON record per line, append-only inserts
+LEGACY_DB_FILE = DATA_DIR / "calls_database.json"
+ID_FILE = DATA_DIR / ".next_id"
+DB_LOCK_FILE = DATA_DIR / ".db_lock"  # writers lock this, not DB_FILE - rewrites replace DB_FILE with a new file
+FRAME_FILE = DATA_DIR / "calls_summary.parquet"  # columnar mirror of the flat admin fields, rebuilt when the DB changes
+FRAME_LAYOUT = b"5"  # bump when _build_db_frame's columns change so older mirrors are rebuilt
+GPT_CACHE_DIR = DATA_DIR / "gpt_cache"  # raw GPT responses, one file per analysis_cache_key + prompt
+GPT_CACHE_TTL = 24 * 60 * 60  # seconds a cached response is reused
+GPT_CACHE_MAX_ENTRIES = 500
 
 # Iron Lady Company Context for GPT Training
 IRON_LADY_CONTEXT = """
@@ -586,151 +610,8 @@ Iron Lady is a transformational leadership and business growth program for women
 - Close with "Powerfully invite you to..." language
 """
 
-def init_db():
-    if not DB_FILE.exists():
-        with open(DB_FILE, 'w') as f:
-            json.dump([], f)
-
-def load_db():
-    init_db()
-    with open(DB_FILE, 'r') as f:
-        return json.load(f)
-
-def save_db(data):
-    with open(DB_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
-
-def cleanup_old_records():
-    """Auto-delete database records older than 7 days"""
-    db = load_db()
-    current_time = datetime.now().timestamp()
-    seven_days_seconds = 7 * 24 * 60 * 60
-    
-    # Filter out records older than 7 days
-    cleaned_db = []
-    deleted_count = 0
-    
-    for record in db:
-        uploaded_at = record.get('uploaded_at')
-        if uploaded_at:
-            try:
-                # Parse ISO format timestamp
-                upload_datetime = datetime.fromisoformat(uploaded_at.replace('Z', '+00:00'))
-                upload_timestamp = upload_datetime.timestamp()
-                
-                # Keep if less than 7 days old
-                if (current_time - upload_timestamp) < seven_days_seconds:
-                    cleaned_db.append(record)
-                else:
-                    deleted_count += 1
-            except:
-                # Keep record if timestamp parsing fails
-                cleaned_db.append(record)
-        else:
-            # Keep records without timestamp (shouldn't happen, but safe)
-            cleaned_db.append(record)
-    
-    # Save cleaned database if anything was deleted
-    if deleted_count > 0:
-        save_db(cleaned_db)
-    
-    return deleted_count
-
-def delete_record(record_id):
-    """Delete a record from the database and optionally offer to re-analyze"""
-    db = load_db()
-    db = [r for r in db if r['id'] != record_id]
-    save_db(db)
-    return True
-
-def check_for_duplicate_analysis(rm_name, client_name, call_date):
-    """Check if analysis already exists for same RM, participant, and date"""
-    db = load_db()
-    for record in db:
-        if (record.get('rm_name') == rm_name and 
-            record.get('client_name') == client_name and 
-            record.get('call_date') == str(call_date)):
-            return record
-    return None
-
-# Admin Feedback Functions
-def get_rm_feedback_history(rm_name):
-    """Get previous admin feedback for a specific RM"""
-    if not rm_name:
-        return []
-    
-    db = load_db()
-    rm_feedbacks = []
-    
-    for record in db:
-        if record.get('rm_name') == rm_name and record.get('admin_feedback'):
-            rm_feedbacks.append({
-                'date': record.get('call_date'),
-                'score': record.get('analysis', {}).get('overall_score', 0),
-                'feedback': record.get('admin_feedback', {}).get('feedback_text', ''),
-                'focus_areas': record.get('admin_feedback', {}).get('focus_areas', ''),
-                'call_type': record.get('call_type')
-            })
-    
-    # Sort by date (most recent last)
-    rm_feedbacks.sort(key=lambda x: x['date'])
-    return rm_feedbacks
-
-def save_admin_feedback(record_id, feedback_text, focus_areas, rating):
-    """Save admin feedback to a call record"""
-    db = load_db()
-    
-    for record in db:
-        if record['id'] == record_id:
-            record['admin_feedback'] = {
-                'feedback_text': feedback_text,
-                'focus_areas': focus_areas,
-                'rating': rating,
-                'feedback_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'feedback_by': 'Admin'
-            }
-            break
-    
-    save_db(db)
-    return True
-
-def analyze_call_with_gpt(call_type, additional_context, manual_scores=None, rm_name=None):
-    """Enhanced GPT analysis with robust Iron Lady parameters, case study detection, and admin feedback context"""
-    try:
-        if manual_scores:
-            return generate_analysis_from_scores(manual_scores, call_type, "Manual scoring with GPT-generated insights")
-        
-        # Get previous admin feedback for this RM
-        previous_feedback = get_rm_feedback_history(rm_name) if rm_name else []
-        
-        # Build feedback context
-        feedback_context = ""
-        if previous_feedback:
-            feedback_context = "\n\n**🎯 ADMIN FEEDBACK HISTORY FOR THIS RM:**\n"
-            feedback_context += f"This RM ({rm_name}) has received admin feedback in {len(previous_feedback)} previous calls. "
-            feedback_context += "Pay special attention to previously identified improvement areas:\n\n"
-            
-            for i, fb in enumerate(previous_feedback[-3:], 1):  # Last 3 feedbacks
-                feedback_context += f"**Call {i} - {fb['date']}** ({fb['call_type']}, Score: {fb['score']}/100):\n"
-                feedback_context += f"📝 Admin Feedback: \"{fb['feedback']}\"\n"
-                if fb.get('focus_areas'):
-                    feedback_context += f"🎯 Focus Areas: {fb['focus_areas']}\n"
-                feedback_context += "\n"
-            
-            feedback_context += "**⚡ CRITICAL INSTRUCTION:** Evaluate this current call considering the admin's previous feedback. "
-            feedback_context += "Has the RM improved in the mentioned areas? Are they repeating mistakes? "
-            feedback_context += "In your analysis, explicitly comment on whether the RM has addressed previous admin feedback. "
-            feedback_context += "If improvements are seen, acknowledge them positively. If issues persist, emphasize them strongly.\n"
-        
-        focus_areas = CALL_TYPE_FOCUS.get(call_type, [])
-        
-        prompt = f"""{IRON_LADY_CONTEXT}
-{feedback_context}
-**YOUR TASK:**
-Analyze this {call_type} call based on the Iron Lady methodology. This is a CRITICAL analysis that will be used for RM coaching, so be EXTREMELY DETAILED and SPECIFIC.
-
-**CALL CONTENT:**
-{additional_context}
+# Static part of the analysis prompt that follows the call content - built once, identical for every request
+ANALYSIS_PROMPT_TAIL = """
 
 **CRITICAL: IRON LADY CASE STUDIES TO DETECT**
 Listen carefully for these SPECIFIC participant names and their stories. If ANY of these names are mentioned, note it explicitly:
@@ -997,15 +878,15 @@ If any of these are mentioned BY EXACT NAME or clear reference, note it:
 
 **OUTPUT FORMAT - Respond ONLY with this JSON:**
 
-{{
-    "core_dimensions": {{
+{
+    "core_dimensions": {
         "rapport_building": <0-20>,
         "needs_discovery": <0-25>,
         "solution_presentation": <0-25>,
         "objection_handling": <0-15>,
         "closing_technique": <0-15>
-    }},
-    "iron_lady_parameters": {{
+    },
+    "iron_lady_parameters": {
         "profile_understanding": <0-10>,
         "credibility_building": <0-10>,
         "principles_usage": <0-10>,
@@ -1016,7 +897,7 @@ If any of these are mentioned BY EXACT NAME or clear reference, note it:
         "commitment_getting": <0-10>,
         "contextualisation": <0-10>,
         "excitement_creation": <0-10>
-    }},
+    },
     "case_studies_mentioned": [
         "List EXACT names mentioned (e.g., Neha, Rashmi, Chandana, etc.)",
         "If NONE mentioned, return empty array []"
@@ -1038,22 +919,736 @@ If any of these are mentioned BY EXACT NAME or clear reference, note it:
     "urgency_tactics": ["List urgency tactics used: limited spots, closing date, etc."],
     "call_quality_summary": "2-3 sentences summarizing the OVERALL QUALITY of this call. What made it good or bad? Be specific about what the RM did well and what they missed. Mention SPECIFIC moments from the call.",
     "justification": "1-2 sentences explaining the scores. Focus on the MOST CRITICAL gaps or strengths."
-}}
+}
 
 **BE STRICT**: Most calls will score 50-70/100. Only truly exceptional calls following ALL guidelines score 80+. Don't be generous - be accurate and help RMs improve."""
 
-        response = openai.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are an expert Iron Lady call analyst. You are STRICT and ACCURATE. You score based on what was ACTUALLY SAID, not what should have been said. You ALWAYS detect and list case study names and principle names if mentioned. You count participant name usage precisely. You are training RMs to be excellent, so your feedback must be honest and specific."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2,
-            response_format={"type": "json_object"}
+@lru_cache(maxsize=None)
+def _analysis_task_header(call_type):
+    """Per-call-type task line of the analysis prompt"""
+    return f"""**YOUR TASK:**
+Analyze this {call_type} call based on the Iron Lady methodology. This is a CRITICAL analysis that will be used for RM coaching, so be EXTREMELY DETAILED and SPECIFIC.
+
+**CALL CONTENT:**
+"""
+
+def _strict_object(properties):
+    """JSON schema object for structured outputs - strict mode needs every property required and no extras"""
+    return {"type": "object", "properties": properties, "required": list(properties), "additionalProperties": False}
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+# Structured outputs schema mirroring the prompt's OUTPUT FORMAT - the API enforces the shape, so every key is present
+GPT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "iron_lady_call_analysis",
+        "strict": True,
+        "schema": _strict_object({
+            "core_dimensions": _strict_object(dict.fromkeys(CORE_KEYS, {"type": "integer"})),
+            "iron_lady_parameters": _strict_object(dict.fromkeys(IL_KEYS, {"type": "integer"})),
+            "case_studies_mentioned": _STRING_LIST,
+            "principles_mentioned": _STRING_LIST,
+            "participant_name_usage_count": {"type": "integer"},
+            "powerfully_invite_used": {"type": "boolean"},
+            "commitments_secured": _STRING_LIST,
+            "bhag_initial": {"type": "string"},
+            "bhag_expanded": {"type": "string"},
+            "gap_quantified": {"type": "string"},
+            "urgency_tactics": _STRING_LIST,
+            "call_quality_summary": {"type": "string"},
+            "justification": {"type": "string"}
+        })
+    }
+}
+
+def _dumps(obj):
+    """Serialize to compact UTF-8 JSON bytes (no indentation, unicode kept as-is)"""
+    if orjson:
+        # NumPy scalars are written as plain numbers, as the stdlib fallback does for float64
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _dump_line(record):
+    """Serialize one record as a compact JSONL line (bytes)"""
+    if orjson:
+        # orjson writes the newline itself - no second bytes object from concatenation
+        return orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    return _dumps(record) + b"\n"
+
+def _dumps_pretty(obj):
+    """Serialize to 2-space indented UTF-8 JSON bytes for downloads"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _parse_json(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _parse_legacy_db():
+    """Parse the old single-array JSON file straight from an mmap (orjson takes the buffer, no bytes copy)"""
+    with open(LEGACY_DB_FILE, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if not orjson:
+            return json.loads(mm[:])
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+def init_db():
+    if not DB_FILE.exists():
+        DATA_DIR.mkdir(exist_ok=True)  # the data directory may have been removed since this rerun started
+        # Migrate the old single-array JSON database on first run
+        records = []
+        if LEGACY_DB_FILE.exists():
+            records = _parse_legacy_db()
+        save_db(records)
+
+def iter_records():
+    """Stream records from the JSONL database one line at a time"""
+    init_db()
+    with open(DB_FILE, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield _parse_json(line)
+
+# cache_resource hands back the cached object itself (cache_data would deep-copy every record on each hit)
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _load_db_cached(mtime_ns, size):
+    # Arguments are only the cache key - any write changes the file's mtime/size
+    return list(iter_records())
+
+def _db_version():
+    """(mtime_ns, size) of the database file - the key every cached view of it is stored under"""
+    init_db()
+    stat = DB_FILE.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+def load_db():
+    """Current records - a fresh list, but the record dicts are shared with the cache and must not be mutated"""
+    return list(_load_db_cached(*_db_version()))
+
+def db_record_count():
+    """Number of records, read from the cache without copying the list"""
+    return len(_load_db_cached(*_db_version()))
+
+def _read_frame_mirror(version):
+    """Columnar summary from the Parquet mirror, or None if it is missing or older than the database"""
+    try:
+        meta = pq.read_schema(FRAME_FILE).metadata or {}
+        if meta.get(b"db_version") == b"%d:%d" % version and meta.get(b"layout") == FRAME_LAYOUT:
+            return pq.read_table(FRAME_FILE).to_pandas()
+    except (OSError, pa.ArrowException):
+        pass
+    return None
+
+def _write_frame_mirror(df, version):
+    """Persist the summary frame (tagged with the database version) so a fresh process can skip rebuilding it"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"db_version": b"%d:%d" % version, b"layout": FRAME_LAYOUT})
+    tmp = FRAME_FILE.with_suffix(".tmp")
+    try:
+        pq.write_table(table, tmp)
+        os.replace(tmp, FRAME_FILE)
+    except OSError:
+        pass
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _db_frame_cached(mtime_ns, size):
+    df = _read_frame_mirror((mtime_ns, size))
+    if df is None:
+        df = _build_db_frame(_load_db_cached(mtime_ns, size))
+        _write_frame_mirror(df, (mtime_ns, size))
+    return df
+
+# Per-parameter Iron Lady score columns of the summary frame (NaN where a call has no parameter scores)
+IL_FRAME_COLUMNS = [f"il.{k}" for k in IL_KEYS]
+
+def _build_db_frame(records):
+    analyses = [r['analysis'] for r in records]
+    il_params = [a.get('iron_lady_parameters', {}) for a in analyses]
+    return pd.DataFrame({
+        'id': [r['id'] for r in records],
+        'call_date': [r['call_date'] for r in records],
+        'rm_name': [r['rm_name'] for r in records],
+        'rm_name_lower': [r['rm_name'].lower() for r in records],  # case-folded once for the Dashboard name search
+        'client_name': [r['client_name'] for r in records],
+        'call_type': [r.get('call_type') for r in records],
+        # Categorical: equality filters compare int codes and .str tests run once per distinct outcome
+        'pitch_outcome': pd.Categorical([r['pitch_outcome'] for r in records]),
+        'overall_score': np.array([a.get('overall_score', 0) for a in analyses], dtype=np.float64),
+        'methodology_compliance': np.array([a.get('methodology_compliance', 0) for a in analyses], dtype=np.float64),
+        **{col: np.array([p.get(k, np.nan) for p in il_params], dtype=np.float64) for col, k in zip(IL_FRAME_COLUMNS, IL_KEYS)},
+        'analysis_key': [r.get('analysis_key') for r in records],
+    })
+
+def load_db_frame():
+    """Records, a flat DataFrame of the aggregated fields (row i = record i) and the (mtime_ns, size) version they came from"""
+    version = _db_version()
+    return list(_load_db_cached(*version)), _db_frame_cached(*version), version
+
+def record_json(record):
+    """Pretty JSON download payload for a record - built only when the download is clicked"""
+    return _dumps_pretty(record)
+
+# Admin score-range filter: labels in bucket order for np.digitize over these edges (half-open, [lo, hi))
+SCORE_RANGE_EDGES = np.array([50, 70, 85], dtype=np.float64)
+SCORE_RANGES = ("Needs Work (<50)", "Average (50-69)", "Good (70-84)", "Excellent (85-100)")
+SCORE_FILTER_OPTIONS = ("All",) + tuple(reversed(SCORE_RANGES))
+
+# Remaining fixed widget options, built once (widgets get the same tuple every rerun)
+GUIDE_TABS = ("Core Dimensions", "Iron Lady Parameters", "Call Type Focus", "27 Principles & Case Studies")
+ADMIN_TABS = ("📊 Database Records", "📦 S3 Analysis JSONs", "🎤 S3 Audio Files")
+REPLACE_OPTIONS = ("Cancel upload", "Replace existing analysis with new one")
+ITEMS_PER_PAGE_OPTIONS = (10, 25, 50, 100, 200, "All")
+
+def newest_first_page(positions, start, size):
+    """Positions for one page of a newest-first listing - slices from the end instead of reversing the whole tuple"""
+    end = len(positions) - start
+    return positions[max(end - size, 0):max(end, 0)][::-1]
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def rm_filter_options(db_version):
+    """'All' plus every RM name, sorted - the Admin RM filter choices for one database version"""
+    return ("All",) + tuple(_db_frame_cached(*db_version)['rm_name'].drop_duplicates().sort_values().tolist())
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def build_admin_overview(db_version):
+    """Admin Overall Statistics and the Performance by Call Type table - computed once per database version"""
+    df_all = _db_frame_cached(*db_version)
+    stats = {
+        "success_count": int(df_all['pitch_outcome'].str.contains("Success", regex=False).sum()) if len(df_all) else 0,
+        "avg_score": df_all['overall_score'].mean(),
+        "avg_compliance": df_all['methodology_compliance'].mean(),
+        "unique_rms": df_all['rm_name'].nunique()
+    }
+    ct_stats = (df_all.assign(call_type=df_all['call_type'].fillna('Unknown'), is_high=df_all['overall_score'] >= 70)
+                .groupby('call_type', sort=False)
+                .agg(count=('overall_score', 'size'), avg=('overall_score', 'mean'), high_rate=('is_high', 'mean')))
+    ct_df = pd.DataFrame({
+        'Call Type': ct_stats.index.tolist(),
+        'Count': ct_stats['count'].tolist(),
+        'Avg Score': [f"{v:.1f}" for v in ct_stats['avg']],
+        'Success Rate': [f"{v * 100:.0f}%" for v in ct_stats['high_rate']]
+    })
+    return stats, ct_df
+
+# Admin View tables - cached per (database version, filtered row positions) so unrelated reruns skip the rebuild
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_admin_table(db_version, positions):
+    """Filtered Results table for the given rows of the database snapshot"""
+    rows = _db_frame_cached(*db_version).iloc[list(positions)]
+    records = _load_db_cached(*db_version)
+    analyses = [records[i].get('analysis', {}) for i in positions]
+    score = rows['overall_score'].to_numpy()
+    return pd.DataFrame({
+        "Status": np.select([score >= 80, score >= 60], ["🟢", "🟡"], "🔴"),
+        "ID": rows['id'].to_numpy(),
+        "Date": rows['call_date'].to_numpy(),
+        "RM": rows['rm_name'].to_numpy(),
+        "Participant": rows['client_name'].to_numpy(),
+        "Call Type": rows['call_type'].fillna('N/A').to_numpy(),
+        "Score": score,
+        "IL %": rows['methodology_compliance'].to_numpy(),
+        "Outcome": rows['pitch_outcome'].to_numpy(),
+        "Summary": [a.get('call_summary', 'N/A') for a in analyses],
+        "Top Strengths": ["; ".join(a.get('key_insights', {}).get('strengths', [])[:3]) for a in analyses],
+        "Coaching": ["; ".join(a.get('coaching_recommendations', [])[:3]) for a in analyses]
+    })
+
+# One Arrow payload for the whole page of results - numbers stay numeric (formatted by the browser), score drawn as a bar, long text columns kept narrow
+ADMIN_TABLE_COLUMNS = {
+    "Score": st.column_config.ProgressColumn("Score", min_value=0, max_value=100, format="%.1f"),
+    "IL %": st.column_config.NumberColumn("IL %", format="%.1f%%"),
+    "Summary": st.column_config.TextColumn("Summary", width="large"),
+    "Top Strengths": st.column_config.TextColumn("Top Strengths", width="medium"),
+    "Coaching": st.column_config.TextColumn("Coaching", width="medium")
+}
+
+# Static Dimension/Max columns of the per-call score tables - only Score/Percentage are filled per analysis
+CORE_DISPLAY_BASE = pd.DataFrame({"Dimension": [_pretty(k) for k in CORE_KEYS], "Max": [CORE_WEIGHTS[k] for k in CORE_KEYS]})
+IL_DISPLAY_BASE = pd.DataFrame({"Dimension": [_pretty(k) for k in IL_KEYS], "Max": [IL_WEIGHTS[k] for k in IL_KEYS]})
+SCORE_TABLE_COLUMNS = {"Percentage": st.column_config.NumberColumn("Percentage", format="%.0f%%")}
+
+def build_score_table(base, keys, scores):
+    """Score table for one analysis from a precomputed display base; parameters the analysis lacks are left out"""
+    table = base.assign(Score=pd.Series(scores, dtype=np.float64).reindex(keys).to_numpy())
+    table = table[table["Score"].notna()]
+    return table.assign(Percentage=(table["Score"] / table["Max"] * 100).round())
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_param_table(db_version, positions):
+    """Iron Lady Parameter Performance table (best first) for the given rows, or None when no call has parameter scores"""
+    rows = _db_frame_cached(*db_version).iloc[list(positions)]
+    # Column means over the selected rows - NaN skips calls missing that parameter
+    param_avg = rows[IL_FRAME_COLUMNS].set_axis(IL_KEYS, axis=1).mean().dropna().sort_values(ascending=False, kind='stable')
+    
+    if param_avg.empty:
+        return None
+    avg_scores = param_avg.to_numpy(dtype=np.float64)
+    return pd.DataFrame({
+        "Parameter": [_pretty(param) for param in param_avg.index],
+        "Avg Score": [f"{score:.1f}/10" for score in avg_scores],
+        "%": [f"{pct:.0f}%" for pct in avg_scores / 10 * 100],
+        "Status": np.select([avg_scores >= 8, avg_scores >= 6], ["🟢 Excellent", "🟡 Good"], "🔴 Needs Focus")
+    })
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_comprehensive_csv(db_version, positions):
+    """Comprehensive CSV export (all scores, percentages and improvement areas) as UTF-8 bytes"""
+    records = _load_db_cached(*db_version)
+    filtered_db = [records[i] for i in positions]
+    comprehensive_data = []
+    for record in filtered_db:
+        analysis = record.get('analysis', {})
+        core_dims = analysis.get('core_dimensions', {})
+        il_params = analysis.get('iron_lady_parameters', {})
+        insights = analysis.get('key_insights', {})
+        pred = analysis.get('outcome_prediction', {})
+        
+        # Base record info
+        row = {
+            "ID": record['id'],
+            "Date": record['call_date'],
+            "RM Name": record['rm_name'],
+            "Participant": record['client_name'],
+            "Call Type": record.get('call_type', 'N/A'),
+            "Duration (min)": record.get('call_duration', 'N/A'),
+            "Outcome": record['pitch_outcome'],
+            "Overall Score": f"{analysis.get('overall_score', 0):.1f}",
+            "IL Compliance %": f"{analysis.get('methodology_compliance', 0):.1f}",
+            "Effectiveness": analysis.get('call_effectiveness', 'N/A'),
+            "Prediction": _pretty(pred.get('likely_result', 'N/A')),
+            "Confidence %": pred.get('confidence', 0)
+        }
+        
+        # Add core dimensions with percentages (computed and formatted per record, not per cell)
+        cd_max = [CORE_WEIGHTS.get(dim, 10) for dim in core_dims]
+        cd_pct = np.char.mod("%.0f%%", np.array(list(core_dims.values()), dtype=np.float64) / np.array(cd_max, dtype=np.float64) * 100)
+        for (dim, score), max_score, pct_str in zip(core_dims.items(), cd_max, cd_pct):
+            row[f"CD: {_pretty(dim)}"] = f"{score}/{max_score}"
+            row[f"CD: {_pretty(dim)} %"] = str(pct_str)
+        
+        # Add IL parameters with percentages and status
+        sorted_il_params = sorted(il_params.items(), key=lambda x: x[1], reverse=True)
+        il_pct = np.array([score for _, score in sorted_il_params], dtype=np.float64) / 10 * 100
+        il_pct_str = np.char.mod("%.0f%%", il_pct)
+        il_status = np.where(il_pct >= 80, "Excellent", np.where(il_pct >= 60, "Good", "Needs Focus"))
+        for (param, score), pct_str, status in zip(sorted_il_params, il_pct_str, il_status):
+            row[f"IL: {_pretty(param)}"] = f"{score}/10"
+            row[f"IL: {_pretty(param)} %"] = str(pct_str)
+            row[f"IL: {_pretty(param)} Status"] = str(status)
+        
+        # Add areas needing improvement
+        needs_improvement = []
+        for param, score in sorted_il_params:
+            if (score / 10 * 100) < 60:
+                needs_improvement.append(_pretty(param))
+        
+        row["Areas Needing Improvement"] = "; ".join(needs_improvement) if needs_improvement else "None - All parameters good"
+        
+        # Add top 3 strengths
+        strengths = insights.get('strengths', [])
+        row["Top Strengths"] = "; ".join(strengths[:3]) if strengths else "N/A"
+        
+        # Add top 3 gaps
+        gaps = insights.get('critical_gaps', [])
+        row["Critical Gaps"] = "; ".join(gaps[:3]) if gaps else "N/A"
+        
+        # Add coaching recommendations
+        coaching = analysis.get('iron_lady_specific_coaching', [])
+        row["Coaching Focus"] = "; ".join(coaching[:3]) if coaching else "N/A"
+        
+        comprehensive_data.append(row)
+    
+    return pd.DataFrame(comprehensive_data).to_csv(index=False).encode('utf-8')
+
+def _invalidate_db_caches(keep_mirror=False):
+    # mtime/size keys already change on write; clearing also covers coarse mtime clocks and frees the stale snapshot
+    _load_db_cached.clear()
+    _db_frame_cached.clear()
+    if not keep_mirror:
+        FRAME_FILE.unlink(missing_ok=True)
+
+def _extend_frame_mirror(record, old_version, new_version):
+    """Append one record's row to the Parquet mirror if it matches the pre-append database, else drop it"""
+    df = _read_frame_mirror(old_version)
+    if df is None:
+        FRAME_FILE.unlink(missing_ok=True)
+        return
+    df = pd.concat([df, _build_db_frame([record])], ignore_index=True)
+    # concat falls back to object when the new row brings an unseen outcome
+    df['pitch_outcome'] = df['pitch_outcome'].astype('category')
+    _write_frame_mirror(df, new_version)
+
+def _shrink_frame_mirror(deleted_ids, expected_rows, old_version, new_version):
+    """Drop deleted records' rows from the Parquet mirror if it matches the pre-delete database, else drop the mirror"""
+    df = _read_frame_mirror(old_version)
+    if df is not None:
+        df = df[~df['id'].isin(deleted_ids)].reset_index(drop=True)
+    # A row count mismatch means the rewrite was not a pure deletion (e.g. a concurrent append was overwritten)
+    if df is None or len(df) != expected_rows:
+        FRAME_FILE.unlink(missing_ok=True)
+        return
+    _write_frame_mirror(df, new_version)
+
+def _lock(f):
+    """Exclusive advisory lock on an open file (released when it is closed)"""
+    if fcntl:
+        fcntl.flock(f, fcntl.LOCK_EX)
+
+@contextmanager
+def _db_write_lock():
+    """Exclusive lock shared by every database writer (released on exit)"""
+    with open(DB_LOCK_FILE, 'a') as f:
+        _lock(f)
+        yield
+
+def _replace_db(payload):
+    """Swap in new database contents atomically - readers take no lock, so they must never see a half-written file"""
+    tmp_file = DB_FILE.with_suffix('.tmp')
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, DB_FILE)
+
+def save_db(data):
+    """Replace the whole database (Delete All / migration - edits of existing records go through update_db)"""
+    payload = b"".join(_dump_line(record) for record in data)
+    with _db_write_lock():
+        _replace_db(payload)
+    _invalidate_db_caches()
+
+def update_db(fn):
+    """Read-modify-write the database under the writer lock; fn gets the current records and returns the new list (None = no change)"""
+    init_db()
+    # Reading and rewriting under one lock means an append from another session can't be overwritten
+    with _db_write_lock():
+        old_stat = DB_FILE.stat()
+        with open(DB_FILE, 'rb') as f:
+            records = [_parse_json(line) for line in f if line.strip()]
+        data = fn(records)
+        if data is None:
+            return None
+        _replace_db(b"".join(_dump_line(record) for record in data))
+        new_stat = DB_FILE.stat()
+    # A pure deletion (every kept record is one of the objects read above) trims the Parquet mirror instead of dropping it
+    old_ids = {id(record) for record in records}
+    kept = {id(record) for record in data}
+    deleted_ids = None
+    if len(kept) == len(data) and kept <= old_ids:
+        deleted_ids = [record['id'] for record in records if id(record) not in kept]
+    _invalidate_db_caches(keep_mirror=deleted_ids is not None)
+    if deleted_ids is not None:
+        _shrink_frame_mirror(
+            deleted_ids, len(data),
+            (old_stat.st_mtime_ns, old_stat.st_size),
+            (new_stat.st_mtime_ns, new_stat.st_size)
         )
+    return data
+
+def append_record(record):
+    """Append a single record without rewriting the existing database"""
+    init_db()
+    line = _dump_line(record)
+    with _db_write_lock(), open(DB_FILE, 'ab') as f:
+        old_stat = os.fstat(f.fileno())
+        f.write(line)
+        f.flush()
+        new_stat = os.fstat(f.fileno())
+    _invalidate_db_caches(keep_mirror=True)
+    # A cold start after an upload then reads the mirror instead of rebuilding it from every record
+    _extend_frame_mirror(
+        record,
+        (old_stat.st_mtime_ns, old_stat.st_size),
+        (new_stat.st_mtime_ns, new_stat.st_size)
+    )
+
+def _next_id():
+    """Reserve the next record id from the counter file (seeded from the database on first use)"""
+    init_db()
+    with open(ID_FILE, 'a+') as f:
+        _lock(f)
+        f.seek(0)
+        text = f.read().strip()
+        n = int(text) if text else max((r['id'] for r in iter_records()), default=0) + 1
+        f.seek(0)
+        f.truncate()
+        f.write(str(n + 1))
+        f.flush()
+        return n
+
+# Sweeps of an unchanged database are spaced out - records only cross the 7-day line slowly
+CLEANUP_INTERVAL = 10 * 60
+
+@st.cache_resource
+def _cleanup_marks():
+    return {}
+
+def cleanup_old_records():
+    """Auto-delete database records older than 7 days"""
+    marks = _cleanup_marks()
+    now = time.time()
+    if marks.get("version") == _db_version() and now - marks.get("at", 0) < CLEANUP_INTERVAL:
+        return 0
+    
+    current_time = datetime.now().timestamp()
+    seven_days_seconds = 7 * 24 * 60 * 60
+    deleted_count = 0
+    
+    def drop_expired(db):
+        nonlocal deleted_count
+        # Filter out records older than 7 days
+        cleaned_db = []
+        
+        for record in db:
+            uploaded_at = record.get('uploaded_at')
+            if uploaded_at:
+                try:
+                    # Parse ISO format timestamp
+                    upload_datetime = datetime.fromisoformat(uploaded_at.replace('Z', '+00:00'))
+                    upload_timestamp = upload_datetime.timestamp()
+                    
+                    # Keep if less than 7 days old
+                    if (current_time - upload_timestamp) < seven_days_seconds:
+                        cleaned_db.append(record)
+                    else:
+                        deleted_count += 1
+                except:
+                    # Keep record if timestamp parsing fails
+                    cleaned_db.append(record)
+            else:
+                # Keep records without timestamp (shouldn't happen, but safe)
+                cleaned_db.append(record)
+        
+        # Save cleaned database only if anything was deleted
+        return cleaned_db if deleted_count > 0 else None
+    
+    update_db(drop_expired)
+    
+    marks.update(version=_db_version(), at=now)
+    return deleted_count
+
+def delete_record(record_id):
+    """Delete a record from the database and optionally offer to re-analyze"""
+    update_db(lambda db: [r for r in db if r['id'] != record_id])
+    return True
+
+def check_for_duplicate_analysis(rm_name, client_name, call_date):
+    """Check if analysis already exists for same RM, participant, and date"""
+    # Matched on the cached summary frame - a submit doesn't re-read and re-parse the database file
+    db, df_all, _ = load_db_frame()
+    hits = np.flatnonzero(
+        (df_all['rm_name'] == rm_name).to_numpy()
+        & (df_all['client_name'] == client_name).to_numpy()
+        & (df_all['call_date'] == str(call_date)).to_numpy()
+    )
+    return db[hits[0]] if len(hits) else None
+
+def find_identical_analysis(analysis_key):
+    """Latest successfully analyzed record for the same recording and form inputs, or None"""
+    db, df_all, _ = load_db_frame()
+    for i in np.flatnonzero((df_all['analysis_key'] == analysis_key).to_numpy())[::-1]:
+        if not analysis_failed(db[i]['analysis']):
+            return db[i]
+    return None
+
+# Admin Feedback Functions
+def get_rm_feedback_history(rm_name):
+    """Get previous admin feedback for a specific RM"""
+    if not rm_name:
+        return []
+    
+    db = load_db()
+    rm_feedbacks = []
+    
+    for record in db:
+        if record.get('rm_name') == rm_name and record.get('admin_feedback'):
+            rm_feedbacks.append({
+                'date': record.get('call_date'),
+                'score': record.get('analysis', {}).get('overall_score', 0),
+                'feedback': record.get('admin_feedback', {}).get('feedback_text', ''),
+                'focus_areas': record.get('admin_feedback', {}).get('focus_areas', ''),
+                'call_type': record.get('call_type')
+            })
+    
+    # Sort by date (most recent last)
+    rm_feedbacks.sort(key=lambda x: x['date'])
+    return rm_feedbacks
+
+def save_admin_feedback(record_id, feedback_text, focus_areas, rating):
+    """Save admin feedback to a call record"""
+    feedback = {
+        'feedback_text': feedback_text,
+        'focus_areas': focus_areas,
+        'rating': rating,
+        'feedback_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'feedback_by': 'Admin'
+    }
+    update_db(lambda db: [{**r, 'admin_feedback': feedback} if r['id'] == record_id else r for r in db])
+    return True
+
+# Per-session cap on GPT analyses: at most GPT_RATE_LIMIT submits in any GPT_RATE_WINDOW seconds
+GPT_RATE_LIMIT = 3
+GPT_RATE_WINDOW = 300
+GPT_BULK_CONCURRENCY = 5  # parallel requests for the Admin re-analysis
+GPT_BULK_LIMIT = 20  # records re-analyzed per click
+GPT_BULK_RATE_LIMIT = 40  # separate per-session budget for re-analysis: records per GPT_RATE_WINDOW
+# Retries - transient OpenAI errors are retried with exponential backoff before falling back
+GPT_MAX_ATTEMPTS = 3
+GPT_RETRY_MAX_WAIT = 30
+GPT_REQUEST_TIMEOUT = 30.0  # seconds per request (and between streamed chunks) - the SDK default of 600 s would stall the upload
+
+def gpt_submits_left(key="gpt_times", limit=GPT_RATE_LIMIT):
+    """GPT submits this session may still make in the current window (uploads and re-analysis keep separate budgets)"""
+    now = time.time()
+    history = st.session_state.setdefault(key, [])
+    history[:] = [t for t in history if now - t < GPT_RATE_WINDOW]
+    return max(limit - len(history), 0)
+
+def gpt_rate_limited():
+    """True if this session has used up its upload GPT submits for the current window"""
+    return gpt_submits_left() == 0
+
+def record_gpt_submit(key="gpt_times", count=1):
+    """Count GPT submits against this session's rate limit - called only once the analysis actually starts"""
+    st.session_state.setdefault(key, []).extend([time.time()] * count)
+
+def analysis_cache_key(file_bytes, *fields):
+    """SHA-256 over the recording bytes and the form fields that feed the analysis"""
+    digest = hashlib.sha256(file_bytes)
+    digest.update(_dumps(fields))
+    return digest.hexdigest()
+
+@lru_cache(maxsize=None)
+def _gpt_retry_errors():
+    """Transient OpenAI errors worth retrying (resolved on first use, after the client has imported the SDK)"""
+    import openai
+    return (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError)
+
+def _stream_gpt_analysis(prompt, preview=True):
+    """Run the GPT analysis, retrying rate limits/timeouts with exponential backoff (1s, 2s, ... up to GPT_RETRY_MAX_WAIT)"""
+    # One status box for all attempts - it only turns to an error once the last attempt has failed
+    status = st.status("🤖 Analyzing call...", expanded=True) if preview else None
+    placeholder = status.empty() if status else None
+    try:
+        for attempt in range(GPT_MAX_ATTEMPTS):
+            try:
+                text = _stream_gpt_once(prompt, placeholder)
+                break
+            except _gpt_retry_errors():
+                if attempt == GPT_MAX_ATTEMPTS - 1:
+                    raise
+                if status:
+                    placeholder.empty()
+                    status.update(label=f"🔁 Retrying analysis ({attempt + 2}/{GPT_MAX_ATTEMPTS})...", state="running")
+                time.sleep(min(2 ** attempt, GPT_RETRY_MAX_WAIT))
+    except Exception:
+        if status:
+            status.update(label="⚠️ Analysis interrupted", state="error", expanded=False)
+        raise
+    if status:
+        status.update(label="✅ Analysis complete", state="complete", expanded=False)
+    return text
+
+# A score field is complete once its value is followed by ',' or '}' - lets the preview show scores before the JSON closes
+_SCORE_FIELD = re.compile(r'"(\w+)"\s*:\s*(\d+)\s*[,}]')
+
+def _stream_gpt_once(prompt, placeholder=None):
+    """Single streamed GPT request, showing each parameter score in placeholder as it arrives"""
+    stream = get_openai_client().chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": "You are an expert Iron Lady call analyst. You are STRICT and ACCURATE. You score based on what was ACTUALLY SAID, not what should have been said. You ALWAYS detect and list case study names and principle names if mentioned. You count participant name usage precisely. You are training RMs to be excellent, so your feedback must be honest and specific."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.2,
+        response_format=GPT_RESPONSE_FORMAT,
+        stream=True
+    )
+    text = ""
+    scanned = 0
+    lines = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content or ""
+        if not delta:
+            continue
+        text += delta
+        if placeholder:
+            # Only the text after the last complete field is re-scanned
+            for m in _SCORE_FIELD.finditer(text, scanned):
+                scanned = m.end()
+                if m.group(1) in ALL_WEIGHTS:
+                    lines.append(f"• {_pretty(m.group(1))}: {m.group(2)}/{ALL_WEIGHTS[m.group(1)]}")
+                    placeholder.markdown("  \n".join(lines))
+    return text
+
+def _prune_gpt_cache():
+    """Drop the oldest cached GPT responses beyond GPT_CACHE_MAX_ENTRIES"""
+    entries = []
+    for entry in os.scandir(GPT_CACHE_DIR):
+        if entry.name.endswith('.json'):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                pass
+    entries.sort()
+    for _, path in entries[:-GPT_CACHE_MAX_ENTRIES]:
+        Path(path).unlink(missing_ok=True)
+
+def _gpt_scores_data(cache_key, prompt, preview=True):
+    """Parsed GPT JSON for a prompt - re-submits of the same call skip the API round trip"""
+    # File cache rather than st.cache_data: a cached function would record and replay every streamed preview update
+    digest = hashlib.sha256(prompt.encode('utf-8'))
+    digest.update((cache_key or "").encode('utf-8'))
+    cache_file = GPT_CACHE_DIR / f"{digest.hexdigest()}.json"
+    try:
+        if time.time() - cache_file.stat().st_mtime < GPT_CACHE_TTL:
+            return _parse_json(cache_file.read_bytes())
+    except FileNotFoundError:
+        pass
+    
+    analysis_text = _stream_gpt_analysis(prompt, preview)
+    # Structured outputs guarantee schema-valid JSON unless the output was cut short - parse before caching so a bad response is never persisted
+    scores_data = _parse_json(analysis_text)
+    GPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix('.tmp')
+    tmp_file.write_text(analysis_text, encoding='utf-8')
+    os.replace(tmp_file, cache_file)
+    _prune_gpt_cache()
+    return scores_data
+
+def analyze_call_with_gpt(call_type, additional_context, manual_scores=None, rm_name=None, cache_key=None, preview=True, quiet=False):
+    """Enhanced GPT analysis with robust Iron Lady parameters, case study detection, and admin feedback context"""
+    # quiet: no Streamlit output at all (worker threads) - a failure only shows up in the returned analysis
+    try:
+        if manual_scores:
+            return generate_analysis_from_scores(manual_scores, call_type, "Manual scoring with GPT-generated insights")
+        
+        # Get previous admin feedback for this RM
+        previous_feedback = get_rm_feedback_history(rm_name) if rm_name else []
+        
+        # Build feedback context
+        feedback_context = ""
+        if previous_feedback:
+            feedback_context = "\n\n**🎯 ADMIN FEEDBACK HISTORY FOR THIS RM:**\n"
+            feedback_context += f"This RM ({rm_name}) has received admin feedback in {len(previous_feedback)} previous calls. "
+            feedback_context += "Pay special attention to previously identified improvement areas:\n\n"
+            
+            for i, fb in enumerate(previous_feedback[-3:], 1):  # Last 3 feedbacks
+                feedback_context += f"**Call {i} - {fb['date']}** ({fb['call_type']}, Score: {fb['score']}/100):\n"
+                feedback_context += f"📝 Admin Feedback: \"{fb['feedback']}\"\n"
+                if fb.get('focus_areas'):
+                    feedback_context += f"🎯 Focus Areas: {fb['focus_areas']}\n"
+                feedback_context += "\n"
+            
+            feedback_context += "**⚡ CRITICAL INSTRUCTION:** Evaluate this current call considering the admin's previous feedback. "
+            feedback_context += "Has the RM improved in the mentioned areas? Are they repeating mistakes? "
+            feedback_context += "In your analysis, explicitly comment on whether the RM has addressed previous admin feedback. "
+            feedback_context += "If improvements are seen, acknowledge them positively. If issues persist, emphasize them strongly.\n"
         
-        analysis_text = response.choices[0].message.content
-        scores_data = json.loads(analysis_text)
+        prompt = f"{IRON_LADY_CONTEXT}\n{feedback_context}\n{_analysis_task_header(call_type)}{additional_context}{ANALYSIS_PROMPT_TAIL}"
+
+        # The prompt is part of the cache key too, so new admin feedback for the RM still triggers a fresh analysis
+        scores_data = _gpt_scores_data(cache_key, prompt, preview and not quiet)
         
         # Extract metadata for enhanced tracking
         metadata = {
@@ -1079,38 +1674,66 @@ If any of these are mentioned BY EXACT NAME or clear reference, note it:
             metadata  # Pass metadata
         )
     except Exception as e:
-        st.error(f"GPT Error: {str(e)}")
-        return generate_analysis_from_scores({
-            "rapport_building": 10, "needs_discovery": 12, "solution_presentation": 12,
-            "objection_handling": 8, "closing_technique": 8
-        }, call_type, f"Error: {str(e)}")
-
+        if not quiet:
+            st.warning(f"⚠️ GPT Error: {str(e)} - the call was scored with neutral fallback scores; re-analyze it from Admin View")
+        analysis = generate_analysis_from_scores(CORE_DEFAULTS, call_type, f"Error: {str(e)}")
+        analysis["gpt_error"] = str(e)  # fallback scores - picked up by the Admin re-analysis
+        return analysis
+
+def analysis_failed(analysis):
+    """True for an analysis saved with fallback scores after a GPT error (older records only carry it in the summary)"""
+    return "gpt_error" in analysis or "% IL compliance. Error: " in analysis.get('call_summary', '')
+
+@st.cache_resource
+def get_gpt_pool():
+    """Worker pool for concurrent GPT requests - bounds how many run at once across all sessions"""
+    return ThreadPoolExecutor(max_workers=GPT_BULK_CONCURRENCY)
+
+def reanalyze_records(records):
+    """Re-run GPT analysis for several records concurrently; returns the new analyses in input order (None where GPT failed again)"""
+    ctx = get_script_run_ctx()
+    
+    def _run(record):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return analyze_call_with_gpt(record['call_type'], record['additional_context'], rm_name=record['rm_name'], quiet=True)
+    
+    results = get_gpt_pool().map(_run, records)
+    return [None if analysis_failed(analysis) else analysis for analysis in results]
+
+def _record_identity(record):
+    """Key that picks out one stored record across reloads - ids alone can repeat (e.g. restored backups)"""
+    return (record['id'], record.get('uploaded_at'), record.get('analysis_key'))
+
+def _bottom_k(scores, k):
+    """Indices of the k lowest scores in ascending order (ties keep parameter order) without a full sort"""
+    kth = np.partition(scores, k - 1)[k - 1]
+    below = np.flatnonzero(scores < kth)
+    ties = np.flatnonzero(scores == kth)[:k - len(below)]
+    idx = np.concatenate([below, ties])
+    return idx[np.argsort(scores[idx], kind='stable')]
+
+def _score_kernel(core_scores, il_scores):
+    """Numeric core of the scoring: weighted totals, per-parameter percentages and the weakest parameters"""
+    core_total = float(core_scores.sum())
+    il_total = float(il_scores.sum())
+    overall_score = (core_total * 0.6) + (il_total * 0.4)
+    core_pct = core_scores / CORE_MAX * 100
+    il_pct = il_scores / IL_MAX * 100
+    core_bottom = _bottom_k(core_scores, 3)
+    il_bottom = _bottom_k(il_scores, 4)
+    return overall_score, il_total, core_pct, il_pct, core_bottom, il_bottom
+
+# Pure function of its inputs - memoized across reruns (cache_data returns a copy, so callers can't mutate the cached dict)
+@st.cache_data(show_spinner=False, max_entries=1024)
 def generate_analysis_from_scores(core_dims, call_type, justification, il_params=None, metadata=None):
     """Generate complete analysis from scores with enhanced tracking"""
     
-    core_dimensions = {
-        "rapport_building": core_dims.get("rapport_building", 10),
-        "needs_discovery": core_dims.get("needs_discovery", 12),
-        "solution_presentation": core_dims.get("solution_presentation", 12),
-        "objection_handling": core_dims.get("objection_handling", 8),
-        "closing_technique": core_dims.get("closing_technique", 8)
-    }
+    core_dimensions = {k: core_dims.get(k, dv) for k, dv in CORE_DEFAULTS.items()}
     
     if il_params is None:
         il_params = {}
     
-    iron_lady_parameters = {
-        "profile_understanding": il_params.get("profile_understanding", 5),
-        "credibility_building": il_params.get("credibility_building", 5),
-        "principles_usage": il_params.get("principles_usage", 5),
-        "case_studies_usage": il_params.get("case_studies_usage", 5),
-        "gap_creation": il_params.get("gap_creation", 5),
-        "bhag_fine_tuning": il_params.get("bhag_fine_tuning", 5),
-        "urgency_creation": il_params.get("urgency_creation", 5),
-        "commitment_getting": il_params.get("commitment_getting", 5),
-        "contextualisation": il_params.get("contextualisation", 5),
-        "excitement_creation": il_params.get("excitement_creation", 5)
-    }
+    iron_lady_parameters = {k: il_params.get(k, dv) for k, dv in IL_DEFAULTS.items()}
     
     # Enhanced metadata tracking
     if metadata is None:
@@ -1128,11 +1751,10 @@ def generate_analysis_from_scores(core_dims, call_type, justification, il_params
         "urgency_tactics": metadata.get("urgency_tactics", [])
     }
     
-    core_total = sum(core_dimensions.values())
-    il_total = sum(iron_lady_parameters.values())
+    core_scores = np.array(_CORE_GET(core_dimensions), dtype=np.float64)
+    il_scores = np.array(_IL_GET(iron_lady_parameters), dtype=np.float64)
     
-    overall_score = (core_total * 0.6) + (il_total * 0.4)
-    methodology_compliance = il_total
+    overall_score, methodology_compliance, core_pct, il_pct, core_bottom, il_bottom = _score_kernel(core_scores, il_scores)
     
     if overall_score >= 85:
         effectiveness = "Excellent"
@@ -1148,27 +1770,25 @@ def generate_analysis_from_scores(core_dims, call_type, justification, il_params
     missed_opportunities = []
     best_moments = []
     
-    for param, score in core_dimensions.items():
-        max_score = IRON_LADY_PARAMETERS["Core Quality Dimensions"][param]["weight"]
-        pct = (score / max_score) * 100
-        param_name = param.replace('_', ' ').title()
-        
-        if pct >= 80:
-            strengths.append(f"Strong {param_name} - {score}/{max_score} ({pct:.0f}%)")
+    # Core + IL parameters stacked in ALL_KEYS order; strings are built only for flagged indices
+    all_scores = {**core_dimensions, **iron_lady_parameters}
+    all_pct = np.concatenate([core_pct, il_pct])
+    n_core = len(CORE_KEYS)
+    
+    for i in np.flatnonzero(all_pct >= 80):
+        param = ALL_KEYS[i]
+        param_name = _pretty(param)
+        if i < n_core:
+            strengths.append(f"Strong {param_name} - {all_scores[param]}/{ALL_WEIGHTS[param]} ({all_pct[i]:.0f}%)")
             best_moments.append(f"Excellent {param_name}")
-        elif pct < 50:
-            critical_gaps.append(f"Weak {param_name} - {score}/{max_score}")
-            missed_opportunities.append(f"Improve {param_name}")
+        else:
+            strengths.append(f"Strong {param_name} - {all_scores[param]}/{ALL_WEIGHTS[param]}")
     
-    for param, score in iron_lady_parameters.items():
-        pct = (score / 10) * 100
-        param_name = param.replace('_', ' ').title()
-        
-        if pct >= 80:
-            strengths.append(f"Strong {param_name} - {score}/10")
-        elif pct < 50:
-            critical_gaps.append(f"Weak {param_name} - {score}/10")
-            missed_opportunities.append(f"Improve {param_name}")
+    for i in np.flatnonzero(all_pct < 50):
+        param = ALL_KEYS[i]
+        param_name = _pretty(param)
+        critical_gaps.append(f"Weak {param_name} - {all_scores[param]}/{ALL_WEIGHTS[param]}")
+        missed_opportunities.append(f"Improve {param_name}")
     
     if not strengths:
         strengths = ["Professional approach maintained"]
@@ -1182,17 +1802,18 @@ def generate_analysis_from_scores(core_dims, call_type, justification, il_params
     coaching_recommendations = []
     il_coaching = []
     
-    sorted_core = sorted(core_dimensions.items(), key=lambda x: x[1])
-    sorted_il = sorted(iron_lady_parameters.items(), key=lambda x: x[1])
-    
-    for param, score in sorted_core[:3]:
-        max_score = IRON_LADY_PARAMETERS["Core Quality Dimensions"][param]["weight"]
+    for i in core_bottom:
+        param = CORE_KEYS[i]
+        score = core_dimensions[param]
+        max_score = CORE_WEIGHTS[param]
         if score < max_score * 0.7:
-            coaching_recommendations.append(f"Priority: Improve {param.replace('_', ' ').title()} to {int(max_score*0.8)}/{max_score}")
+            coaching_recommendations.append(f"Priority: Improve {_pretty(param)} to {int(max_score*0.8)}/{max_score}")
     
-    for param, score in sorted_il[:4]:
+    for i in il_bottom:
+        param = IL_KEYS[i]
+        score = iron_lady_parameters[param]
         if score < 7:
-            il_coaching.append(f"Focus: {param.replace('_', ' ').title()} needs work (current: {score}/10, target: 8+)")
+            il_coaching.append(f"Focus: {_pretty(param)} needs work (current: {score}/10, target: 8+)")
     
     # Add Iron Lady specific coaching
     if iron_lady_parameters.get('principles_usage', 0) < 7:
@@ -1283,8 +1904,392 @@ def generate_analysis_from_scores(core_dims, call_type, justification, il_params
         "call_summary": summary
     }
 
-# Auto-cleanup old records (7+ days)
-try:
+def render_admin_record_details(record, admin_idx):
+    """Body of one Admin View 'Detailed Call Records' expander"""
+    analysis = record.get('analysis', {})
+    score = analysis.get('overall_score', 0)
+    
+    col1, col2 = st.columns(2)
+    
+    # Each block is one markdown element with hard line breaks ("  \n") instead of one st.write per line
+    with col1:
+        st.markdown("  \n".join([
+            "**Call Information:**",
+            f"• Record ID: {record['id']}",
+            f"• RM: {record['rm_name']}",
+            f"• Participant: {record['client_name']}",
+            f"• Call Type: {record.get('call_type', 'N/A')}",
+            f"• Date: {record['call_date']}",
+            f"• Duration: {record.get('call_duration', 'N/A')} minutes",
+            f"• Outcome: {record['pitch_outcome']}",
+            f"• Storage: {record.get('storage_type', 'local')} (7-day auto-delete)",
+            "• Analysis: S3 JSON (7-day auto-delete)",
+            f"• Analysis Mode: {record.get('analysis_mode', 'N/A')}"
+        ]))
+    
+    with col2:
+        st.write("**Performance Scores:**")
+        st.metric("Overall Score", f"{score:.1f}/100")
+        st.metric("IL Compliance", f"{analysis.get('methodology_compliance', 0):.1f}%")
+        st.metric("Effectiveness", analysis.get('call_effectiveness', 'N/A'))
+        pred = analysis.get('outcome_prediction', {})
+        st.markdown(f"**Prediction:** {_pretty(pred.get('likely_result', 'N/A'))}  \n**Confidence:** {pred.get('confidence', 0)}%")
+    
+    st.write(f"**Summary:** {analysis.get('call_summary', 'N/A')}")
+    
+    # Show parameter breakdown
+    if 'core_dimensions' in analysis:
+        lines = ["**Core Dimensions:**"]
+        for dim, dim_score in analysis['core_dimensions'].items():
+            max_score = CORE_WEIGHTS[dim]
+            pct = (dim_score / max_score) * 100
+            lines.append(f"{_tier_emoji(pct)} {_pretty(dim)}: {dim_score}/{max_score} ({pct:.0f}%)")
+        st.markdown("  \n".join(lines))
+    
+    if 'iron_lady_parameters' in analysis:
+        st.markdown("**Iron Lady Parameters:**")
+        # One chart element for all parameters instead of a text line each
+        il_series = pd.Series(analysis['iron_lady_parameters'], dtype=np.float64).rename(index=_pretty)
+        st.bar_chart(il_series, x_label="Parameter", y_label="Score (/10)")
+        weak = [name for name, param_score in il_series.items() if param_score < 6]
+        st.caption("🟢 8+ · 🟡 6-7 · 🔴 below 6" + (f" | Needs focus: {', '.join(weak)}" if weak else ""))
+    
+    # Show top 3 strengths and gaps
+    insights = analysis.get('key_insights', {})
+    col_a, col_b = st.columns(2)
+    
+    with col_a:
+        if insights.get('strengths'):
+            st.markdown("  \n".join(["**Top Strengths:**"] + [f"✓ {s}" for s in insights['strengths'][:3]]))
+    
+    with col_b:
+        if insights.get('critical_gaps'):
+            st.markdown("  \n".join(["**Critical Gaps:**"] + [f"✗ {g}" for g in insights['critical_gaps'][:3]]))
+    
+    # Coaching recommendations
+    if 'iron_lady_specific_coaching' in analysis:
+        st.markdown("**Iron Lady Coaching:**")
+        st.markdown("\n".join(f"{i}. 💎 {rec}" for i, rec in enumerate(analysis['iron_lady_specific_coaching'][:3], 1)))
+    
+    # Action buttons
+    col_a, col_b, col_c, col_d = st.columns([1, 1, 1, 2])
+    
+    with col_a:
+        if st.button("🗑️ Delete", key=f"del_admin_{record['id']}_{admin_idx}"):
+            delete_record(record['id'])
+            st.success("Deleted!")
+            st.rerun()
+    
+    with col_b:
+        st.download_button(
+            label="📄 Report",
+            data=partial(generate_summary_report, record),
+            file_name=f"Iron_Lady_Report_{record['id']}.txt",
+            mime="text/plain",
+            key=f"sum_adm_{record['id']}_{admin_idx}"
+        )
+    
+    with col_c:
+        st.download_button(
+            label="📥 JSON",
+            data=partial(record_json, record),
+            file_name=f"record_{record['id']}.json",
+            mime="application/json",
+            key=f"json_adm_{record['id']}_{admin_idx}"
+        )
+
+@st.fragment
+def render_dashboard():
+    """Dashboard filters and call history - filter changes rerun only this part of the page"""
+    rm_filter = st.text_input("Filter by your name", placeholder="Enter your name")
+    call_type_filter = st.selectbox("Filter by Call Type", CALL_TYPE_FILTER_OPTIONS)
+    
+    db, df_all, db_version = load_db_frame()
+    
+    # Reruns with the same filters on the same DB version (paging, expanders) reuse the last view
+    view_key = (rm_filter, call_type_filter, db_version)
+    view = st.session_state.get("dashboard_view")
+    if view is None or view["key"] != view_key:
+        # Filters as boolean masks over the summary frame
+        mask = np.ones(len(df_all), dtype=bool)
+        if call_type_filter != "All":
+            mask &= (df_all['call_type'] == call_type_filter).to_numpy()
+        if rm_filter and len(df_all):  # an empty frame has no string dtype for .str
+            mask &= df_all['rm_name_lower'].str.contains(rm_filter.lower(), regex=False).to_numpy()
+        positions = tuple(np.flatnonzero(mask).tolist())
+        view = {"key": view_key, "positions": positions}
+        if positions:
+            # Column reductions over the filtered rows for all three aggregates
+            df_view = df_all.iloc[list(positions)]
+            view["success_rate"] = df_view['pitch_outcome'].str.contains("Success", regex=False).mean() * 100
+            view["avg_score"] = df_view['overall_score'].mean()
+            view["avg_compliance"] = df_view['methodology_compliance'].mean()
+        st.session_state["dashboard_view"] = view
+    
+    # Only the current page's records are pulled out of the database - counts and aggregates come from the frame
+    positions = view["positions"]
+    
+    if not positions:
+        st.info("No calls found. Upload your first recording!")
+    else:
+        st.write(f"**Total Calls:** {len(positions)}")
+        
+        success_rate = view["success_rate"]
+        avg_score = view["avg_score"]
+        avg_compliance = view["avg_compliance"]
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Success Rate", f"{success_rate:.1f}%")
+        with col2:
+            st.metric("Avg Score", f"{avg_score:.1f}/100")
+        with col3:
+            st.metric("Avg IL Compliance", f"{avg_compliance:.1f}%")
+        with col4:
+            st.metric("Total Calls", len(positions))
+        
+        st.markdown("---")
+        st.subheader("📋 Call History")
+        
+        # Pagination - only the current page's expanders are built
+        dash_items_per_page = 20
+        total_pages = (len(positions) + dash_items_per_page - 1) // dash_items_per_page
+        
+        if total_pages > 1:
+            dash_page = st.number_input(
+                f"Page (1-{total_pages}):",
+                min_value=1,
+                max_value=total_pages,
+                value=1,
+                key="dash_page"
+            )
+        else:
+            dash_page = 1
+        
+        start_idx = (dash_page - 1) * dash_items_per_page
+        page_records = [db[i] for i in newest_first_page(positions, start_idx, dash_items_per_page)]
+        st.caption(f"Showing {len(page_records)} of {len(positions)} calls (Page {dash_page}/{total_pages})")
+        
+        for record in page_records:
+            analysis = record.get('analysis', {})
+            score = analysis.get('overall_score', 0)
+            score_emoji = _tier_emoji(score)
+            
+            with st.expander(
+                f"{score_emoji} {record['call_type']} - {record['client_name']} - {record['call_date']} "
+                f"(Score: {score:.1f}/100)"
+            ):
+                col1, col2 = st.columns([3, 1])
+                
+                with col1:
+                    st.markdown("  \n".join([
+                        f"**RM:** {record['rm_name']}",
+                        f"**Participant:** {record['client_name']}",
+                        f"**Call Type:** {record['call_type']}",
+                        f"**Outcome:** {record['pitch_outcome']}",
+                        f"**Duration:** {record.get('call_duration', 'N/A')} min",
+                        f"**Storage:** {record.get('storage_type', 'local')} (7-day auto-delete)",
+                        "**Analysis JSON:** S3 (7-day auto-delete)",
+                        f"**Summary:** {analysis.get('call_summary', 'N/A')}"
+                    ]))
+                
+                with col2:
+                    st.metric("Score", f"{score:.1f}/100")
+                    st.metric("IL Compliance", f"{analysis.get('methodology_compliance', 0):.1f}%")
+                    st.write(f"**Effectiveness:**")
+                    st.write(analysis.get('call_effectiveness', 'N/A'))
+                
+                insights = analysis.get('key_insights', {})
+                st.markdown("  \n".join(["**Top 3 Strengths:**"] + [f"✓ {s}" for s in insights.get('strengths', [])[:3]]))
+                
+                st.markdown("  \n".join(["**Top 3 Gaps:**"] + [f"✗ {g}" for g in insights.get('critical_gaps', [])[:3]]))
+                
+                # Case Studies & Principles Checklist (NEW!)
+                if 'enhanced_tracking' in analysis:
+                    st.markdown("---")
+                    st.markdown("**🎯 Methodology Checklist:**")
+                    
+                    track = analysis['enhanced_tracking']
+                    col_cs, col_pr = st.columns(2)
+                    
+                    with col_cs:
+                        case_studies = track.get('case_studies_mentioned', [])
+                        if case_studies:
+                            st.success(f"✅ Case Studies: {', '.join(case_studies[:2])}")
+                        else:
+                            st.error("❌ No case studies used")
+                    
+                    with col_pr:
+                        principles = track.get('principles_mentioned', [])
+                        if principles:
+                            st.success(f"✅ Principles: {', '.join(principles[:2])}")
+                        else:
+                            st.error("❌ No principles by name")
+                    
+                    # Key methodology checks
+                    col_m1, col_m2 = st.columns(2)
+                    with col_m1:
+                        if track.get('powerfully_invite_used'):
+                            st.success("✅ 'Powerfully Invite' used")
+                        else:
+                            st.error("❌ 'Powerfully Invite' missing")
+                    
+                    with col_m2:
+                        commits = len(track.get('commitments_secured', []))
+                        if commits > 0:
+                            st.success(f"✅ {commits} commitments secured")
+                        else:
+                            st.error("❌ No commitments secured")
+                
+                # Action buttons
+                col_a, col_b, col_c = st.columns([1, 1, 2])
+                with col_a:
+                    if st.button("🗑️ Delete", key=f"del_dash_{record['id']}"):
+                        delete_record(record['id'])
+                        st.success("Deleted!")
+                        st.rerun()
+                
+                with col_b:
+                    st.download_button(
+                        label="📄 Summary",
+                        data=partial(generate_summary_report, record),
+                        file_name=f"Iron_Lady_Summary_{record['rm_name']}_{record['call_date']}.txt",
+                        mime="text/plain",
+                        key=f"sum_{record['id']}"
+                    )
+                
+                with col_c:
+                    st.download_button(
+                        label="📥 Full JSON",
+                        data=partial(record_json, record),
+                        file_name=f"analysis_{record['client_name']}_{record['call_date']}.json",
+                        mime="application/json",
+                        key=f"json_{record['id']}"
+                    )
+
+@st.fragment
+def render_admin_filtered_records(db, df_all, db_version):
+    """Admin View filters and everything driven by them - reruns on its own when a filter changes"""
+    # Filters
+    st.markdown("---")
+    st.subheader("🔍 Advanced Filters")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        selected_rm = st.selectbox("Filter by RM", rm_filter_options(db_version))
+    with col2:
+        selected_call_type = st.selectbox("Filter by Call Type", CALL_TYPE_FILTER_OPTIONS)
+    with col3:
+        selected_outcome = st.selectbox("Filter by Outcome", OUTCOME_FILTER_OPTIONS)
+    with col4:
+        score_filter = st.selectbox("Score Range", SCORE_FILTER_OPTIONS)
+    
+    # Reruns with the same filters on the same DB version (expanders, buttons, other tabs) reuse the last view
+    view_key = (selected_rm, selected_call_type, selected_outcome, score_filter, db_version)
+    view = st.session_state.get("admin_filtered_view")
+    if view is None or view["key"] != view_key:
+        # Apply filters - one combined boolean mask over df_all, then pick the matching records
+        mask = np.ones(len(df_all), dtype=bool)
+        if selected_rm != "All":
+            mask &= (df_all['rm_name'] == selected_rm).to_numpy()
+        if selected_call_type != "All":
+            mask &= (df_all['call_type'] == selected_call_type).to_numpy()
+        if selected_outcome != "All":
+            mask &= (df_all['pitch_outcome'] == selected_outcome).to_numpy()
+        if score_filter != "All":
+            mask &= np.digitize(df_all['overall_score'].to_numpy(), SCORE_RANGE_EDGES) == SCORE_RANGES.index(score_filter)
+        positions = tuple(np.flatnonzero(mask).tolist())
+        view = {"key": view_key, "positions": positions}
+        st.session_state["admin_filtered_view"] = view
+    
+    # Only the visible page of records is pulled out of the database - the table and CSV work from positions
+    positions = view["positions"]
+    
+    st.markdown("---")
+    st.subheader(f"📊 Filtered Results ({len(positions)} calls)")
+    
+    # DataFrame
+    if positions:
+        # Pagination - only the current page's rows are built and sent to the browser
+        table_rows_per_page = 50
+        total_pages = (len(positions) + table_rows_per_page - 1) // table_rows_per_page
+        
+        if total_pages > 1:
+            table_page = st.number_input(
+                f"Page (1-{total_pages}):",
+                min_value=1,
+                max_value=total_pages,
+                value=1,
+                key="admin_table_page"
+            )
+        else:
+            table_page = 1
+        
+        start_idx = (table_page - 1) * table_rows_per_page
+        df = build_admin_table(db_version, positions[start_idx:start_idx + table_rows_per_page])
+        st.dataframe(df, column_config=ADMIN_TABLE_COLUMNS, use_container_width=True, hide_index=True)
+        if total_pages > 1:
+            st.caption(f"Showing {len(df)} of {len(positions)} calls (Page {table_page}/{total_pages})")
+        
+        # Comprehensive CSV export - built only when the button is clicked
+        st.download_button(
+            label="📥 Download Comprehensive Report (CSV)",
+            data=partial(build_comprehensive_csv, db_version, positions),
+            file_name=f"iron_lady_comprehensive_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+            help="Includes all scores, parameters, percentages, and improvement areas"
+        )
+        
+        # Parameter Performance Analysis
+        st.markdown("---")
+        st.subheader("📊 Iron Lady Parameter Performance")
+        
+        param_df = build_param_table(db_version, positions)
+        if param_df is not None:
+            st.dataframe(param_df, use_container_width=True, hide_index=True)
+            st.info("💡 **Team Coaching Focus:** Prioritize 🔴 parameters for immediate training and practice")
+        
+        # Detailed records
+        st.markdown("---")
+        st.subheader("🔍 Detailed Call Records")
+        
+        # Pagination - newest first, only the current page's expanders are built
+        detail_items_per_page = 15
+        total_pages = (len(positions) + detail_items_per_page - 1) // detail_items_per_page
+        
+        if total_pages > 1:
+            detail_page = st.number_input(
+                f"Page (1-{total_pages}):",
+                min_value=1,
+                max_value=total_pages,
+                value=1,
+                key="admin_detail_page"
+            )
+        else:
+            detail_page = 1
+        
+        start_idx = (detail_page - 1) * detail_items_per_page
+        page_records = [db[i] for i in newest_first_page(positions, start_idx, detail_items_per_page)]
+        if total_pages > 1:
+            st.caption(f"Showing {len(page_records)} of {len(positions)} calls (Page {detail_page}/{total_pages})")
+        
+        for admin_idx, record in enumerate(page_records, start_idx):
+            analysis = record.get('analysis', {})
+            score = analysis.get('overall_score', 0)
+            score_emoji = _tier_emoji(score)
+            
+            with st.expander(
+                f"{score_emoji} [{record['id']}] {record['rm_name']} - {record['call_type']} - "
+                f"{record['client_name']} ({record['call_date']}) - Score: {score:.1f}/100"
+            ):
+                # Closed/unopened records render only the button - details are built on demand
+                open_key = f"adm_open_{record['id']}_{admin_idx}"
+                if st.session_state.get(open_key) or st.button("📂 Show details", key=f"adm_show_{record['id']}_{admin_idx}"):
+                    st.session_state[open_key] = True
+                    render_admin_record_details(record, admin_idx)
+
+# Auto-cleanup old records (7+ days)
+try:
     deleted_count = cleanup_old_records()
     if deleted_count > 0:
         st.toast(f"🗑️ Auto-cleaned {deleted_count} records older than 7 days")
@@ -1328,39 +2333,35 @@ except Exception as e:
 st.sidebar.markdown("---")
 st.sidebar.markdown("### 🗄️ Database")
 try:
-    db = load_db()
-    st.sidebar.info(f"**Records:** {len(db)}")
+    st.sidebar.info(f"**Records:** {db_record_count()}")
     st.sidebar.caption("🗑️ Auto-cleanup: 7 days")
 except:
     st.sidebar.caption("Database initializing...")
 
-page = st.sidebar.radio("Navigate", ["Upload & Analyze", "Dashboard", "Admin View", "Parameters Guide"])
-
 # Parameters Guide Page
-if page == "Parameters Guide":
+def parameters_guide_page():
     st.title("📚 Iron Lady Parameters Guide")
     st.markdown("Complete breakdown of all parameters and Iron Lady methodology")
     
-    tab1, tab2, tab3, tab4 = st.tabs(["Core Dimensions", "Iron Lady Parameters", "Call Type Focus", "27 Principles & Case Studies"])
+    tab1, tab2, tab3, tab4 = st.tabs(GUIDE_TABS)
     
     with tab1:
         st.subheader("🎯 Core Quality Dimensions")
-        for param, details in IRON_LADY_PARAMETERS["Core Quality Dimensions"].items():
-            with st.expander(f"**{param.replace('_', ' ').title()}** ({details['weight']} pts)"):
-                st.write(f"**Description:** {details['description']}")
+        for label, description in CORE_GUIDE_ENTRIES:
+            with st.expander(label):
+                st.write(description)
     
     with tab2:
         st.subheader("💎 Iron Lady Parameters")
-        for param, details in IRON_LADY_PARAMETERS["Iron Lady Specific Parameters"].items():
-            with st.expander(f"**{param.replace('_', ' ').title()}** ({details['weight']} pts)"):
-                st.write(f"**Description:** {details['description']}")
+        for label, description in IL_GUIDE_ENTRIES:
+            with st.expander(label):
+                st.write(description)
     
     with tab3:
         st.subheader("📋 Call Type Focus")
-        for call_type, params in CALL_TYPE_FOCUS.items():
+        for call_type, param_bullets in CALL_TYPE_FOCUS_BULLETS.items():
             with st.expander(f"**{call_type}**"):
-                for param in params:
-                    st.write(f"• {param.replace('_', ' ').title()}")
+                st.markdown(param_bullets)
     
     with tab4:
         st.subheader("🎓 Iron Lady Methodology")
@@ -1393,8 +2394,313 @@ if page == "Parameters Guide":
         st.write("• Access to mentors and alumni network")
         st.write("• Personal branding and business scaling focus")
 
+# Analysis results panel (Upload page)
+@st.fragment
+def render_analysis_results(record):
+    """Results panel for an analyzed call - kept in session state so later reruns redraw it without re-running the analysis"""
+    analysis = record['analysis']
+    call_type = record['call_type']
+    rm_name = record['rm_name']
+    
+    st.markdown("---")
+    st.subheader(f"📊 Analysis Results - {call_type}")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        # Color-coded quality only (no numbers)
+        if analysis['overall_score'] >= 80:
+            st.success("### ✅ Excellent Call")
+        elif analysis['overall_score'] >= 65:
+            st.info("### 🟡 Good Call")
+        else:
+            st.error("### ❌ Needs Improvement")
+    
+    with col2:
+        # IL Compliance as color
+        if analysis['methodology_compliance'] >= 75:
+            st.success("✅ Strong IL Adherence")
+        elif analysis['methodology_compliance'] >= 55:
+            st.warning("🟡 Moderate IL Usage")
+        else:
+            st.error("❌ Weak IL Methodology")
+    
+    with col3:
+        effectiveness = analysis['call_effectiveness']
+        if effectiveness == "Excellent":
+            st.success(f"✅ {effectiveness}")
+        elif effectiveness == "Good":
+            st.info(f"🟡 {effectiveness}")
+        else:
+            st.warning(f"⚠️ {effectiveness}")
+    
+    with col4:
+        pred_emoji = {"registration_expected": "🎉", "follow_up_needed": "📞", "needs_improvement": "⚠️"}
+        pred_result = analysis['outcome_prediction']['likely_result']
+        pred_display = _pretty(pred_result)
+        
+        if pred_result == "registration_expected":
+            st.success(f"🎉 {pred_display}")
+        elif pred_result == "follow_up_needed":
+            st.info(f"📞 {pred_display}")
+        else:
+            st.warning(f"⚠️ {pred_display}")
+    
+    st.markdown("**Executive Summary:**")
+    st.info(analysis['call_summary'])
+    
+    # Show previous admin feedback if this RM has history
+    previous_feedback = get_rm_feedback_history(rm_name)
+    if previous_feedback:
+        st.markdown("---")
+        st.markdown("### 📋 Your Admin Feedback History")
+        st.caption(f"You have received feedback on {len(previous_feedback)} previous calls")
+        
+        with st.expander(f"💡 View Your Last {min(3, len(previous_feedback))} Feedback(s)", expanded=False):
+            for i, fb in enumerate(reversed(previous_feedback[-3:]), 1):
+                st.markdown(f"**Call {i}: {fb['date']}** - {fb['call_type']} (Score: {fb['score']}/100)")
+                st.info(f"📝 Admin Feedback: {fb['feedback']}")
+                if fb.get('focus_areas'):
+                    st.warning(f"🎯 Focus on: {fb['focus_areas']}")
+                st.markdown("---")
+            
+            st.caption("💡 This feedback was considered in your current call analysis!")
+    
+    # HIGHLIGHT Case Studies & Principles (NEW!)
+    if 'enhanced_tracking' in analysis:
+        track = analysis['enhanced_tracking']
+        
+        # Show prominent highlights if any were used
+        if track['case_studies_mentioned'] or track['principles_mentioned']:
+            st.markdown("---")
+            col_highlight1, col_highlight2 = st.columns(2)
+            
+            with col_highlight1:
+                if track['case_studies_mentioned']:
+                    st.success("### 🌟 Case Studies Used in This Call")
+                    st.markdown("\n".join(f"### ✅ **{case}**" for case in track['case_studies_mentioned']))
+                    st.caption(f"Total: {len(track['case_studies_mentioned'])} success stories shared")
+                else:
+                    st.error("### ❌ No Case Studies Mentioned")
+                    st.caption("Use names: Neha, Rashmi, Chandana, Annapurna, etc.")
+            
+            with col_highlight2:
+                if track['principles_mentioned']:
+                    st.success("### 💎 Principles Used in This Call")
+                    st.markdown("\n".join(f"### ✅ **{principle}**" for principle in track['principles_mentioned']))
+                    st.caption(f"Total: {len(track['principles_mentioned'])} principles by name")
+                else:
+                    st.error("### ❌ No Principles by Name")
+                    st.caption("Say: 'Fearless Pricing', 'BHAG Mindset', etc.")
+    
+    # Enhanced Tracking Section
+    if 'enhanced_tracking' in analysis:
+        st.markdown("---")
+        st.markdown("### 🎯 Iron Lady Methodology Tracking")
+        
+        track = analysis['enhanced_tracking']
+        
+        col_a, col_b, col_c = st.columns(3)
+        
+        with col_a:
+            st.markdown("**📚 Case Studies Used:**")
+            if track['case_studies_mentioned']:
+                st.success("  \n".join(f"✅ {case}" for case in track['case_studies_mentioned']))
+                st.caption(f"Total: {len(track['case_studies_mentioned'])} case studies")
+            else:
+                st.error("❌ NO case studies mentioned")
+                st.caption("🚨 CRITICAL: Use names like Neha, Rashmi, Chandana")
+        
+        with col_b:
+            st.markdown("**💎 27 Principles Used:**")
+            if track['principles_mentioned']:
+                st.success("  \n".join(f"✅ {principle}" for principle in track['principles_mentioned']))
+                st.caption(f"Total: {len(track['principles_mentioned'])} principles")
+            else:
+                st.error("❌ NO principles by name")
+                st.caption("🚨 CRITICAL: Say exact names (e.g., 'Fearless Pricing')")
+        
+        with col_c:
+            st.markdown("**🎤 Engagement Tracking:**")
+            
+            # Name usage
+            name_count = track.get('participant_name_usage_count', 0)
+            if name_count >= 5:
+                st.success(f"✅ Name used {name_count} times")
+            elif name_count > 0:
+                st.warning(f"⚠️ Name used only {name_count} times")
+                st.caption("Target: 5+ times")
+            else:
+                st.error("❌ Name NOT used")
+            
+            # Powerfully invite
+            if track.get('powerfully_invite_used'):
+                st.success("✅ 'Powerfully Invite' used")
+            else:
+                st.error("❌ 'Powerfully Invite' NOT used")
+            
+            # Commitments
+            commits = track.get('commitments_secured', [])
+            if commits:
+                st.success(f"✅ {len(commits)} commitments secured")
+            else:
+                st.error("❌ NO commitments secured")
+        
+        # BHAG and Gap (expandable)
+        with st.expander("🎯 BHAG & Gap Analysis", expanded=False):
+            col_x, col_y = st.columns(2)
+            with col_x:
+                st.markdown("**BHAG Journey:**")
+                st.write(f"**Initial:** {track.get('bhag_initial', 'Not captured')}")
+                st.write(f"**Expanded:** {track.get('bhag_expanded', 'Not expanded')}")
+                if track.get('bhag_expanded') != 'Not expanded' and track.get('bhag_expanded') != track.get('bhag_initial'):
+                    st.success("✅ BHAG expanded successfully")
+                else:
+                    st.warning("⚠️ BHAG not expanded")
+            
+            with col_y:
+                st.markdown("**Gap & Urgency:**")
+                st.write(f"**Gap:** {track.get('gap_quantified', 'Not quantified')}")
+                urgency = track.get('urgency_tactics', [])
+                if urgency:
+                    st.markdown("  \n".join(["**Urgency tactics:**"] + [f"• {tactic}" for tactic in urgency]))
+                else:
+                    st.warning("⚠️ No urgency created")
+        
+        # Commitments detail (expandable)
+        if commits:
+            with st.expander("✅ Commitments Secured", expanded=False):
+                st.markdown("\n".join(f"{i}. {commit}" for i, commit in enumerate(commits, 1)))
+    
+    st.markdown("---")
+    
+    # Core Dimensions - CHECKBOX DISPLAY (NO SCORES)
+    st.markdown("### 🎯 Core Dimensions")
+    
+    col_cd1, col_cd2 = st.columns(2)
+    
+    core_items = list(analysis['core_dimensions'].items())
+    core_mid = len(core_items) // 2
+    
+    # One markdown element per column - each parameter is a colored line
+    core_lines = []
+    for param, score in core_items:
+        percentage = (score / CORE_WEIGHTS[param]) * 100
+        
+        # Three-tier system for core dimensions too
+        if percentage >= 75:
+            checkbox = "✅"  # Green - Excellent
+            color = "green"
+        elif percentage >= 55:
+            checkbox = "🟡"  # Yellow - Adequate
+            color = "orange"
+        else:
+            checkbox = "❌"  # Red - Poor
+            color = "red"
+        
+        core_lines.append(f":{color}[{checkbox} **{_pretty(param)}**]")
+    
+    with col_cd1:
+        st.markdown("  \n".join(core_lines[:core_mid]))
+    
+    with col_cd2:
+        st.markdown("  \n".join(core_lines[core_mid:]))
+    
+    st.markdown("---")
+    
+    # IL Parameters - CHECKBOX DISPLAY (NEW!)
+    st.markdown("### 💎 Iron Lady Parameters Checklist")
+    
+    # Create checkbox grid
+    col1, col2 = st.columns(2)
+    
+    il_params_list = list(analysis['iron_lady_parameters'].items())
+    mid_point = len(il_params_list) // 2
+    
+    il_lines = []
+    for param, score in il_params_list:
+        # Determine checkbox based on score
+        if score >= 7:
+            checkbox = "✅"  # Green tick - Good
+            color = "green"
+        elif score >= 5:
+            checkbox = "🟡"  # Yellow - Adequate
+            color = "orange"
+        else:
+            checkbox = "❌"  # Red X - Poor
+            color = "red"
+        
+        # Display with color (NO SCORE NUMBERS)
+        il_lines.append(f":{color}[{checkbox} **{_pretty(param)}**]")
+    
+    with col1:
+        st.markdown("  \n".join(il_lines[:mid_point]))
+    
+    with col2:
+        st.markdown("  \n".join(il_lines[mid_point:]))
+    
+    # Summary stats
+    st.markdown("---")
+    il_values = analysis['iron_lady_parameters'].values()
+    il_arr = np.fromiter(il_values, dtype=np.float64, count=len(il_values))
+    excellent = int(np.count_nonzero(il_arr >= 7))
+    adequate = int(np.count_nonzero((il_arr >= 5) & (il_arr < 7)))
+    poor = int(np.count_nonzero(il_arr < 5))
+    total = len(il_arr)
+    
+    col_x, col_y, col_z, col_w = st.columns(4)
+    with col_x:
+        st.metric("✅ Excellent (≥7)", f"{excellent}/{total}")
+    with col_y:
+        st.metric("🟡 Adequate (5-6)", f"{adequate}/{total}")
+    with col_z:
+        st.metric("❌ Poor (<5)", f"{poor}/{total}")
+    with col_w:
+        pass_rate = ((excellent + adequate) / total) * 100
+        if pass_rate >= 80:
+            st.success(f"🌟 {pass_rate:.0f}% Pass")
+        elif pass_rate >= 60:
+            st.info(f"👍 {pass_rate:.0f}% Pass")
+        else:
+            st.warning(f"⚠️ {pass_rate:.0f}% Pass")
+    
+    # One element per category - each item as its own paragraph inside the box
+    insights = analysis['key_insights']
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("### ✅ Strengths")
+        if insights['strengths']:
+            st.success("\n\n".join(f"✓ {s}" for s in insights['strengths']))
+        st.markdown("### 🌟 Best Moments")
+        if insights['best_moments']:
+            st.markdown("\n\n".join(f"⭐ {m}" for m in insights['best_moments']))
+    
+    with col2:
+        st.markdown("### 🔴 Critical Gaps")
+        if insights['critical_gaps']:
+            st.error("\n\n".join(f"✗ {g}" for g in insights['critical_gaps']))
+        st.markdown("### ⚠️ Missed Opportunities")
+        if insights['missed_opportunities']:
+            st.warning("\n\n".join(f"→ {o}" for o in insights['missed_opportunities']))
+    
+    st.markdown("### 💡 General Coaching Recommendations")
+    st.markdown("\n".join(f"{i}. {rec}" for i, rec in enumerate(analysis['coaching_recommendations'], 1)))
+    
+    st.markdown("### 🎓 Iron Lady Specific Coaching")
+    st.markdown("\n".join(f"{i}. 💎 {rec}" for i, rec in enumerate(analysis['iron_lady_specific_coaching'], 1)))
+    
+    # Outcome Prediction
+    st.markdown("### 🔮 Outcome Prediction")
+    pred = analysis['outcome_prediction']
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Likely Result", _pretty(pred['likely_result']))
+        st.metric("Confidence", f"{pred['confidence']}%")
+    with col2:
+        st.write(f"**Reasoning:**")
+        st.write(pred['reasoning'])
+
 # Upload Page
-elif page == "Upload & Analyze":
+def upload_page():
     st.title("📤 Upload Call & Get AI Analysis")
     st.write("AI trained on Iron Lady methodology will analyze your call")
     
@@ -1407,18 +2713,17 @@ elif page == "Upload & Analyze":
         with col1:
             rm_name = st.text_input("RM Name *", placeholder="e.g., Priya Sharma")
             client_name = st.text_input("Participant Name *", placeholder="e.g., Anjali Mehta")
-            call_type = st.selectbox("Call Type *", list(CALL_TYPE_FOCUS.keys()))
+            call_type = st.selectbox("Call Type *", CALL_TYPES)
         
         with col2:
-            pitch_outcome = st.selectbox("Call Outcome *", ["Success - Committed", "Partial - Needs Follow-up", "Not Interested", "Rescheduled"])
+            pitch_outcome = st.selectbox("Call Outcome *", PITCH_OUTCOMES)
             call_date = st.date_input("Call Date *", datetime.now())
             call_duration = st.number_input("Call Duration (minutes)", 1, 120, 15)
         
-        uploaded_file = st.file_uploader("Upload Recording *", type=['mp3', 'wav', 'm4a', 'mp4'], help="Max 40MB")
+        uploaded_file = st.file_uploader("Upload Recording *", type=RECORDING_TYPES, help="Max 40MB")
         
         st.markdown(f"### 📋 Key Focus for {call_type}")
-        focus_params = CALL_TYPE_FOCUS.get(call_type, [])
-        st.info("✓ " + " • ".join([p.replace('_', ' ').title() for p in focus_params[:5]]))
+        st.info("✓ " + CALL_TYPE_FOCUS_TOP5.get(call_type, ""))
         
         if "GPT" in analysis_mode:
             st.markdown("### 📝 Call Summary (AI will analyze this)")
@@ -1491,7 +2796,14 @@ elif page == "Upload & Analyze":
         elif len(additional_context.strip()) < 200:
             st.error("❌ Please provide detailed call summary (minimum 200 characters). AI needs details to analyze accurately!")
         else:
-            # Check for duplicate analysis
+            # Hash straight from the upload's buffer (no bytes copy), releasing the view before the S3 thread reads the file
+            with uploaded_file.getbuffer() as recording:
+                analysis_key = analysis_cache_key(
+                    recording,
+                    call_type, pitch_outcome, rm_name, client_name, additional_context
+                )
+            
+            # Check for duplicate analysis - decided first, so choosing Replace always runs a new analysis
             existing_record = check_for_duplicate_analysis(rm_name, client_name, call_date)
             
             if existing_record:
@@ -1501,7 +2813,7 @@ elif page == "Upload & Analyze":
                 
                 replace_option = st.radio(
                     "What would you like to do?",
-                    ["Cancel upload", "Replace existing analysis with new one"],
+                    REPLACE_OPTIONS,
                     key="replace_decision"
                 )
                 
@@ -1510,539 +2822,118 @@ elif page == "Upload & Analyze":
                     st.stop()
                 else:
                     st.info("✅ Proceeding to replace existing analysis...")
-                    # Delete the old record
-                    delete_record(existing_record['id'])
             
-            with st.spinner(f"🔄 Uploading to S3 and analyzing with AI..."):
-                # Upload to S3
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                file_extension = uploaded_file.name.split('.')[-1]
-                filename = f"{rm_name.replace(' ', '_')}_{call_type.replace(' ', '_')}_{timestamp}.{file_extension}"
-                
-                metadata = {
-                    'rm_name': rm_name,
-                    'client_name': client_name,
-                    'call_type': call_type,
-                    'uploaded_date': datetime.now().isoformat()
-                }
-                
-                s3_url = upload_to_s3(uploaded_file, filename, metadata=metadata)
-                
-                if not s3_url:
-                    st.error("❌ S3 upload failed. Check AWS configuration.")
-                    st.stop()
-                
-                st.success(f"✅ File uploaded to S3 (auto-deletes in 7 days)")
-                
-                # Analyze with RM feedback history
-                analysis = analyze_call_with_gpt(call_type, additional_context, rm_name=rm_name)
-                
-                # Save to database
-                db = load_db()
-                record = {
-                    "id": len(db) + 1,
-                    "rm_name": rm_name,
-                    "client_name": client_name,
-                    "call_type": call_type,
-                    "pitch_outcome": pitch_outcome,
-                    "call_date": str(call_date),
-                    "call_duration": call_duration,
-                    "uploaded_at": datetime.now().isoformat(),
-                    "file_path": s3_url,
-                    "file_name": uploaded_file.name,
-                    "storage_type": "s3",
-                    "expires_at": (datetime.now().timestamp() + (7 * 24 * 60 * 60)),
-                    "additional_context": additional_context,
-                    "notes": notes,
-                    "analysis_mode": "GPT Auto-Analysis (v3.0)",
-                    "analysis": analysis
-                }
-                db.append(record)
-                save_db(db)
-                
-                # Upload analysis to S3
-                analysis_s3_url = upload_analysis_to_s3(record)
-                if analysis_s3_url:
-                    st.success(f"✅ Analysis JSON backed up to S3 (auto-deletes in 7 days)")
-                
-                st.success("✅ Analysis Complete!")
-                
-                # Display results
-                st.markdown("---")
-                st.subheader(f"📊 Analysis Results - {call_type}")
-                
-                col1, col2, col3, col4 = st.columns(4)
+            identical_record = None if existing_record else find_identical_analysis(analysis_key)
+            if identical_record:
+                # Same recording and same summary already analyzed - show that result instead of paying for another GPT call and record
+                st.info(f"ℹ️ Identical recording already analyzed (Record ID {identical_record['id']}) - showing the existing result")
+                existing_analysis = identical_record['analysis']
+                col1, col2 = st.columns(2)
                 with col1:
-                    # Color-coded quality only (no numbers)
-                    if analysis['overall_score'] >= 80:
-                        st.success("### ✅ Excellent Call")
-                    elif analysis['overall_score'] >= 65:
-                        st.info("### 🟡 Good Call")
-                    else:
-                        st.error("### ❌ Needs Improvement")
-                
+                    st.metric("Overall Score", f"{existing_analysis.get('overall_score', 0):.1f}/100")
                 with col2:
-                    # IL Compliance as color
-                    if analysis['methodology_compliance'] >= 75:
-                        st.success("✅ Strong IL Adherence")
-                    elif analysis['methodology_compliance'] >= 55:
-                        st.warning("🟡 Moderate IL Usage")
-                    else:
-                        st.error("❌ Weak IL Methodology")
-                
-                with col3:
-                    effectiveness = analysis['call_effectiveness']
-                    if effectiveness == "Excellent":
-                        st.success(f"✅ {effectiveness}")
-                    elif effectiveness == "Good":
-                        st.info(f"🟡 {effectiveness}")
-                    else:
-                        st.warning(f"⚠️ {effectiveness}")
-                
-                with col4:
-                    pred_emoji = {"registration_expected": "🎉", "follow_up_needed": "📞", "needs_improvement": "⚠️"}
-                    pred_result = analysis['outcome_prediction']['likely_result']
-                    pred_display = pred_result.replace('_', ' ').title()
-                    
-                    if pred_result == "registration_expected":
-                        st.success(f"🎉 {pred_display}")
-                    elif pred_result == "follow_up_needed":
-                        st.info(f"📞 {pred_display}")
-                    else:
-                        st.warning(f"⚠️ {pred_display}")
-                
+                    st.metric("IL Compliance", f"{existing_analysis.get('methodology_compliance', 0):.1f}%")
                 st.markdown("**Executive Summary:**")
-                st.info(analysis['call_summary'])
-                
-                # Show previous admin feedback if this RM has history
-                previous_feedback = get_rm_feedback_history(rm_name)
-                if previous_feedback:
-                    st.markdown("---")
-                    st.markdown("### 📋 Your Admin Feedback History")
-                    st.caption(f"You have received feedback on {len(previous_feedback)} previous calls")
+                st.info(existing_analysis.get('call_summary', 'N/A'))
+                st.download_button(
+                    label="📄 Download Report",
+                    data=partial(generate_summary_report, identical_record),
+                    file_name=f"Iron_Lady_Report_{identical_record['id']}.txt",
+                    mime="text/plain"
+                )
+            elif not (get_bucket_name() and get_s3_client()):
+                # Fail before GPT runs (and before any old record is replaced) rather than after the analysis finishes
+                st.error("❌ S3 upload failed. Check AWS configuration.")
+            elif gpt_rate_limited():
+                st.error(f"❌ Rate limit: at most {GPT_RATE_LIMIT} analyses every {GPT_RATE_WINDOW // 60} minutes. Please wait before submitting again.")
+            else:
+                with st.spinner(f"🔄 Uploading to S3 and analyzing with AI..."):
+                    # Upload to S3
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    file_extension = uploaded_file.name.split('.')[-1]
+                    filename = f"{rm_name.replace(' ', '_')}_{call_type.replace(' ', '_')}_{timestamp}.{file_extension}"
                     
-                    with st.expander(f"💡 View Your Last {min(3, len(previous_feedback))} Feedback(s)", expanded=False):
-                        for i, fb in enumerate(reversed(previous_feedback[-3:]), 1):
-                            st.markdown(f"**Call {i}: {fb['date']}** - {fb['call_type']} (Score: {fb['score']}/100)")
-                            st.info(f"📝 Admin Feedback: {fb['feedback']}")
-                            if fb.get('focus_areas'):
-                                st.warning(f"🎯 Focus on: {fb['focus_areas']}")
-                            st.markdown("---")
-                        
-                        st.caption("💡 This feedback was considered in your current call analysis!")
-                
-                # HIGHLIGHT Case Studies & Principles (NEW!)
-                if 'enhanced_tracking' in analysis:
-                    track = analysis['enhanced_tracking']
+                    metadata = {
+                        'rm_name': rm_name,
+                        'client_name': client_name,
+                        'call_type': call_type,
+                        'uploaded_date': datetime.now().isoformat()
+                    }
                     
-                    # Show prominent highlights if any were used
-                    if track['case_studies_mentioned'] or track['principles_mentioned']:
-                        st.markdown("---")
-                        col_highlight1, col_highlight2 = st.columns(2)
-                        
-                        with col_highlight1:
-                            if track['case_studies_mentioned']:
-                                st.success("### 🌟 Case Studies Used in This Call")
-                                for case in track['case_studies_mentioned']:
-                                    st.markdown(f"### ✅ **{case}**")
-                                st.caption(f"Total: {len(track['case_studies_mentioned'])} success stories shared")
-                            else:
-                                st.error("### ❌ No Case Studies Mentioned")
-                                st.caption("Use names: Neha, Rashmi, Chandana, Annapurna, etc.")
-                        
-                        with col_highlight2:
-                            if track['principles_mentioned']:
-                                st.success("### 💎 Principles Used in This Call")
-                                for principle in track['principles_mentioned']:
-                                    st.markdown(f"### ✅ **{principle}**")
-                                st.caption(f"Total: {len(track['principles_mentioned'])} principles by name")
-                            else:
-                                st.error("### ❌ No Principles by Name")
-                                st.caption("Say: 'Fearless Pricing', 'BHAG Mindset', etc.")
-                
-                # Enhanced Tracking Section
-                if 'enhanced_tracking' in analysis:
-                    st.markdown("---")
-                    st.markdown("### 🎯 Iron Lady Methodology Tracking")
+                    # Recording upload runs in the background while GPT analyzes the call summary
+                    s3_future = submit_background(upload_to_s3, uploaded_file, filename, metadata=metadata)
                     
-                    track = analysis['enhanced_tracking']
+                    # Analyze with RM feedback history
+                    record_gpt_submit()
+                    analysis = analyze_call_with_gpt(call_type, additional_context, rm_name=rm_name, cache_key=analysis_key)
                     
-                    col_a, col_b, col_c = st.columns(3)
+                    s3_url = s3_future.result()
                     
-                    with col_a:
-                        st.markdown("**📚 Case Studies Used:**")
-                        if track['case_studies_mentioned']:
-                            for case in track['case_studies_mentioned']:
-                                st.success(f"✅ {case}")
-                            st.caption(f"Total: {len(track['case_studies_mentioned'])} case studies")
-                        else:
-                            st.error("❌ NO case studies mentioned")
-                            st.caption("🚨 CRITICAL: Use names like Neha, Rashmi, Chandana")
+                    if not s3_url:
+                        # Nothing has been replaced yet, and a resubmit reuses the cached GPT response
+                        st.error("❌ S3 upload failed. Check AWS configuration." + (" The existing analysis was kept." if existing_record else ""))
+                        st.stop()
                     
-                    with col_b:
-                        st.markdown("**💎 27 Principles Used:**")
-                        if track['principles_mentioned']:
-                            for principle in track['principles_mentioned']:
-                                st.success(f"✅ {principle}")
-                            st.caption(f"Total: {len(track['principles_mentioned'])} principles")
-                        else:
-                            st.error("❌ NO principles by name")
-                            st.caption("🚨 CRITICAL: Say exact names (e.g., 'Fearless Pricing')")
+                    st.success(f"✅ File uploaded to S3 (auto-deletes in 7 days)")
                     
-                    with col_c:
-                        st.markdown("**🎤 Engagement Tracking:**")
-                        
-                        # Name usage
-                        name_count = track.get('participant_name_usage_count', 0)
-                        if name_count >= 5:
-                            st.success(f"✅ Name used {name_count} times")
-                        elif name_count > 0:
-                            st.warning(f"⚠️ Name used only {name_count} times")
-                            st.caption("Target: 5+ times")
-                        else:
-                            st.error("❌ Name NOT used")
-                        
-                        # Powerfully invite
-                        if track.get('powerfully_invite_used'):
-                            st.success("✅ 'Powerfully Invite' used")
-                        else:
-                            st.error("❌ 'Powerfully Invite' NOT used")
-                        
-                        # Commitments
-                        commits = track.get('commitments_secured', [])
-                        if commits:
-                            st.success(f"✅ {len(commits)} commitments secured")
-                        else:
-                            st.error("❌ NO commitments secured")
+                    # Save to database
+                    record = {
+                        "id": _next_id(),
+                        "rm_name": rm_name,
+                        "client_name": client_name,
+                        "call_type": call_type,
+                        "pitch_outcome": pitch_outcome,
+                        "call_date": str(call_date),
+                        "call_duration": call_duration,
+                        "uploaded_at": datetime.now().isoformat(),
+                        "file_path": s3_url,
+                        "file_name": uploaded_file.name,
+                        "storage_type": "s3",
+                        "expires_at": (datetime.now().timestamp() + (7 * 24 * 60 * 60)),
+                        "additional_context": additional_context,
+                        "notes": notes,
+                        "analysis_mode": "GPT Auto-Analysis (v3.0)",
+                        "analysis_key": analysis_key,
+                        "analysis": analysis
+                    }
+                    append_record(record)
                     
-                    # BHAG and Gap (expandable)
-                    with st.expander("🎯 BHAG & Gap Analysis", expanded=False):
-                        col_x, col_y = st.columns(2)
-                        with col_x:
-                            st.markdown("**BHAG Journey:**")
-                            st.write(f"**Initial:** {track.get('bhag_initial', 'Not captured')}")
-                            st.write(f"**Expanded:** {track.get('bhag_expanded', 'Not expanded')}")
-                            if track.get('bhag_expanded') != 'Not expanded' and track.get('bhag_expanded') != track.get('bhag_initial'):
-                                st.success("✅ BHAG expanded successfully")
-                            else:
-                                st.warning("⚠️ BHAG not expanded")
-                        
-                        with col_y:
-                            st.markdown("**Gap & Urgency:**")
-                            st.write(f"**Gap:** {track.get('gap_quantified', 'Not quantified')}")
-                            urgency = track.get('urgency_tactics', [])
-                            if urgency:
-                                st.write("**Urgency tactics:**")
-                                for tactic in urgency:
-                                    st.write(f"• {tactic}")
-                            else:
-                                st.warning("⚠️ No urgency created")
+                    # Replace: the old record goes only once the new one is saved
+                    if existing_record:
+                        delete_record(existing_record['id'])
                     
-                    # Commitments detail (expandable)
-                    if commits:
-                        with st.expander("✅ Commitments Secured", expanded=False):
-                            for i, commit in enumerate(commits, 1):
-                                st.write(f"{i}. {commit}")
-                
-                st.markdown("---")
-                
-                # Core Dimensions - CHECKBOX DISPLAY (NO SCORES)
-                st.markdown("### 🎯 Core Dimensions")
-                
-                col_cd1, col_cd2 = st.columns(2)
-                
-                core_items = list(analysis['core_dimensions'].items())
-                core_mid = len(core_items) // 2
-                
-                with col_cd1:
-                    for param, score in core_items[:core_mid]:
-                        param_name = param.replace('_', ' ').title()
-                        max_score = IRON_LADY_PARAMETERS["Core Quality Dimensions"][param]["weight"]
-                        percentage = (score / max_score) * 100
-                        
-                        # Three-tier system for core dimensions too
-                        if percentage >= 75:
-                            checkbox = "✅"  # Green - Excellent
-                            color = "green"
-                        elif percentage >= 55:
-                            checkbox = "🟡"  # Yellow - Adequate
-                            color = "orange"
-                        else:
-                            checkbox = "❌"  # Red - Poor
-                            color = "red"
-                        
-                        st.markdown(f":{color}[{checkbox} **{param_name}**]")
-                
-                with col_cd2:
-                    for param, score in core_items[core_mid:]:
-                        param_name = param.replace('_', ' ').title()
-                        max_score = IRON_LADY_PARAMETERS["Core Quality Dimensions"][param]["weight"]
-                        percentage = (score / max_score) * 100
-                        
-                        # Three-tier system
-                        if percentage >= 75:
-                            checkbox = "✅"  # Green - Excellent
-                            color = "green"
-                        elif percentage >= 55:
-                            checkbox = "🟡"  # Yellow - Adequate
-                            color = "orange"
-                        else:
-                            checkbox = "❌"  # Red - Poor
-                            color = "red"
-                        
-                        st.markdown(f":{color}[{checkbox} **{param_name}**]")
-                
-                st.markdown("---")
-                
-                # IL Parameters - CHECKBOX DISPLAY (NEW!)
-                st.markdown("### 💎 Iron Lady Parameters Checklist")
-                
-                # Create checkbox grid
-                col1, col2 = st.columns(2)
-                
-                il_params_list = list(analysis['iron_lady_parameters'].items())
-                mid_point = len(il_params_list) // 2
-                
-                with col1:
-                    for param, score in il_params_list[:mid_point]:
-                        param_name = param.replace('_', ' ').title()
-                        
-                        # Determine checkbox based on score
-                        if score >= 7:
-                            checkbox = "✅"  # Green tick - Good
-                            color = "green"
-                        elif score >= 5:
-                            checkbox = "🟡"  # Yellow - Adequate
-                            color = "orange"
-                        else:
-                            checkbox = "❌"  # Red X - Poor
-                            color = "red"
-                        
-                        # Display with color (NO SCORE NUMBERS)
-                        st.markdown(f":{color}[{checkbox} **{param_name}**]")
-                
-                with col2:
-                    for param, score in il_params_list[mid_point:]:
-                        param_name = param.replace('_', ' ').title()
-                        
-                        # Determine checkbox based on score
-                        if score >= 7:
-                            checkbox = "✅"  # Green tick - Good
-                            color = "green"
-                        elif score >= 5:
-                            checkbox = "🟡"  # Yellow - Adequate
-                            color = "orange"
-                        else:
-                            checkbox = "❌"  # Red X - Poor
-                            color = "red"
-                        
-                        # Display with color (NO SCORE NUMBERS)
-                        st.markdown(f":{color}[{checkbox} **{param_name}**]")
-                
-                # Summary stats
-                st.markdown("---")
-                excellent = sum(1 for score in analysis['iron_lady_parameters'].values() if score >= 7)
-                adequate = sum(1 for score in analysis['iron_lady_parameters'].values() if 5 <= score < 7)
-                poor = sum(1 for score in analysis['iron_lady_parameters'].values() if score < 5)
-                total = len(analysis['iron_lady_parameters'])
-                
-                col_x, col_y, col_z, col_w = st.columns(4)
-                with col_x:
-                    st.metric("✅ Excellent (≥7)", f"{excellent}/{total}")
-                with col_y:
-                    st.metric("🟡 Adequate (5-6)", f"{adequate}/{total}")
-                with col_z:
-                    st.metric("❌ Poor (<5)", f"{poor}/{total}")
-                with col_w:
-                    pass_rate = ((excellent + adequate) / total) * 100
-                    if pass_rate >= 80:
-                        st.success(f"🌟 {pass_rate:.0f}% Pass")
-                    elif pass_rate >= 60:
-                        st.info(f"👍 {pass_rate:.0f}% Pass")
-                    else:
-                        st.warning(f"⚠️ {pass_rate:.0f}% Pass")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown("### ✅ Strengths")
-                    for s in analysis['key_insights']['strengths']:
-                        st.success(f"✓ {s}")
-                    st.markdown("### 🌟 Best Moments")
-                    for m in analysis['key_insights']['best_moments']:
-                        st.write(f"⭐ {m}")
-                
-                with col2:
-                    st.markdown("### 🔴 Critical Gaps")
-                    for g in analysis['key_insights']['critical_gaps']:
-                        st.error(f"✗ {g}")
-                    st.markdown("### ⚠️ Missed Opportunities")
-                    for o in analysis['key_insights']['missed_opportunities']:
-                        st.warning(f"→ {o}")
-                
-                st.markdown("### 💡 General Coaching Recommendations")
-                for i, rec in enumerate(analysis['coaching_recommendations'], 1):
-                    st.write(f"{i}. {rec}")
-                
-                st.markdown("### 🎓 Iron Lady Specific Coaching")
-                for i, rec in enumerate(analysis['iron_lady_specific_coaching'], 1):
-                    st.write(f"{i}. 💎 {rec}")
-                
-                # Outcome Prediction
-                st.markdown("### 🔮 Outcome Prediction")
-                pred = analysis['outcome_prediction']
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("Likely Result", pred['likely_result'].replace('_', ' ').title())
-                    st.metric("Confidence", f"{pred['confidence']}%")
-                with col2:
-                    st.write(f"**Reasoning:**")
-                    st.write(pred['reasoning'])
+                    # Upload analysis to S3
+                    analysis_s3_url = upload_analysis_to_s3(record)
+                    if analysis_s3_url:
+                        st.success(f"✅ Analysis JSON backed up to S3 (auto-deletes in 7 days)")
+                    
+                    st.success("✅ Analysis Complete!")
+                    
+                    # Display results
+                    st.session_state["last_analysis_record"] = record
+                    render_analysis_results(record)
+    elif "last_analysis_record" in st.session_state:
+        # Later reruns of the page redraw the last results from session state - the form only reports a submit once
+        render_analysis_results(st.session_state["last_analysis_record"])
 
 # Dashboard Page
-elif page == "Dashboard":
+def dashboard_page():
     st.title("📊 My Dashboard")
     
-    rm_filter = st.text_input("Filter by your name", placeholder="Enter your name")
-    call_type_filter = st.selectbox("Filter by Call Type", ["All"] + list(CALL_TYPE_FOCUS.keys()))
-    
-    db = load_db()
-    
-    filtered_db = [r for r in db if not rm_filter or rm_filter.lower() in r['rm_name'].lower()]
-    if call_type_filter != "All":
-        filtered_db = [r for r in filtered_db if r.get('call_type') == call_type_filter]
-    
-    if not filtered_db:
-        st.info("No calls found. Upload your first recording!")
-    else:
-        st.write(f"**Total Calls:** {len(filtered_db)}")
-        
-        success_rate = len([r for r in filtered_db if "Success" in r['pitch_outcome']]) / len(filtered_db) * 100
-        avg_score = sum([r['analysis'].get('overall_score', 0) for r in filtered_db]) / len(filtered_db)
-        avg_compliance = sum([r['analysis'].get('methodology_compliance', 0) for r in filtered_db]) / len(filtered_db)
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Success Rate", f"{success_rate:.1f}%")
-        with col2:
-            st.metric("Avg Score", f"{avg_score:.1f}/100")
-        with col3:
-            st.metric("Avg IL Compliance", f"{avg_compliance:.1f}%")
-        with col4:
-            st.metric("Total Calls", len(filtered_db))
-        
-        st.markdown("---")
-        st.subheader("📋 Call History")
-        
-        for record in reversed(filtered_db):
-            analysis = record.get('analysis', {})
-            score = analysis.get('overall_score', 0)
-            score_emoji = "🟢" if score >= 80 else "🟡" if score >= 60 else "🔴"
-            
-            with st.expander(
-                f"{score_emoji} {record['call_type']} - {record['client_name']} - {record['call_date']} "
-                f"(Score: {score:.1f}/100)"
-            ):
-                col1, col2 = st.columns([3, 1])
-                
-                with col1:
-                    st.write(f"**RM:** {record['rm_name']}")
-                    st.write(f"**Participant:** {record['client_name']}")
-                    st.write(f"**Call Type:** {record['call_type']}")
-                    st.write(f"**Outcome:** {record['pitch_outcome']}")
-                    st.write(f"**Duration:** {record.get('call_duration', 'N/A')} min")
-                    st.write(f"**Storage:** {record.get('storage_type', 'local')} (7-day auto-delete)")
-                    st.write(f"**Analysis JSON:** S3 (7-day auto-delete)")
-                    st.write(f"**Summary:** {analysis.get('call_summary', 'N/A')}")
-                
-                with col2:
-                    st.metric("Score", f"{score:.1f}/100")
-                    st.metric("IL Compliance", f"{analysis.get('methodology_compliance', 0):.1f}%")
-                    st.write(f"**Effectiveness:**")
-                    st.write(analysis.get('call_effectiveness', 'N/A'))
-                
-                st.markdown("**Top 3 Strengths:**")
-                for s in analysis.get('key_insights', {}).get('strengths', [])[:3]:
-                    st.write(f"✓ {s}")
-                
-                st.markdown("**Top 3 Gaps:**")
-                for g in analysis.get('key_insights', {}).get('critical_gaps', [])[:3]:
-                    st.write(f"✗ {g}")
-                
-                # Case Studies & Principles Checklist (NEW!)
-                if 'enhanced_tracking' in analysis:
-                    st.markdown("---")
-                    st.markdown("**🎯 Methodology Checklist:**")
-                    
-                    track = analysis['enhanced_tracking']
-                    col_cs, col_pr = st.columns(2)
-                    
-                    with col_cs:
-                        case_studies = track.get('case_studies_mentioned', [])
-                        if case_studies:
-                            st.success(f"✅ Case Studies: {', '.join(case_studies[:2])}")
-                        else:
-                            st.error("❌ No case studies used")
-                    
-                    with col_pr:
-                        principles = track.get('principles_mentioned', [])
-                        if principles:
-                            st.success(f"✅ Principles: {', '.join(principles[:2])}")
-                        else:
-                            st.error("❌ No principles by name")
-                    
-                    # Key methodology checks
-                    col_m1, col_m2 = st.columns(2)
-                    with col_m1:
-                        if track.get('powerfully_invite_used'):
-                            st.success("✅ 'Powerfully Invite' used")
-                        else:
-                            st.error("❌ 'Powerfully Invite' missing")
-                    
-                    with col_m2:
-                        commits = len(track.get('commitments_secured', []))
-                        if commits > 0:
-                            st.success(f"✅ {commits} commitments secured")
-                        else:
-                            st.error("❌ No commitments secured")
-                
-                # Action buttons
-                col_a, col_b, col_c = st.columns([1, 1, 2])
-                with col_a:
-                    if st.button("🗑️ Delete", key=f"del_dash_{record['id']}"):
-                        delete_record(record['id'])
-                        st.success("Deleted!")
-                        st.rerun()
-                
-                with col_b:
-                    summary_report = generate_summary_report(record)
-                    st.download_button(
-                        label="📄 Summary",
-                        data=summary_report,
-                        file_name=f"Iron_Lady_Summary_{record['rm_name']}_{record['call_date']}.txt",
-                        mime="text/plain",
-                        key=f"sum_{record['id']}"
-                    )
-                
-                with col_c:
-                    analysis_json = json.dumps(record, indent=2)
-                    st.download_button(
-                        label="📥 Full JSON",
-                        data=analysis_json,
-                        file_name=f"analysis_{record['client_name']}_{record['call_date']}.json",
-                        mime="application/json",
-                        key=f"json_{record['id']}"
-                    )
+    render_dashboard()
 
 # Admin View Page
-elif page == "Admin View":
+def admin_page():
     st.title("👨‍💼 Admin Dashboard")
     
     # Create tabs for Database and S3
-    tab_db, tab_s3_analysis, tab_s3_audio = st.tabs(["📊 Database Records", "📦 S3 Analysis JSONs", "🎤 S3 Audio Files"])
+    tab_db, tab_s3_analysis, tab_s3_audio = st.tabs(ADMIN_TABS)
     
     # TAB 1: Database Records (Original Admin View)
     with tab_db:
-        db = load_db()
+        # df_all: one row per record - every aggregate below is a vectorized reduction over it
+        db, df_all, db_version = load_db_frame()
+        stats, ct_df = build_admin_overview(db_version)
         
         if not db:
             st.info("No data available yet.")
@@ -2053,38 +2944,17 @@ elif page == "Admin View":
             with col1:
                 st.metric("Total Calls", len(db))
             with col2:
-                success_count = len([r for r in db if "Success" in r['pitch_outcome']])
-                st.metric("Successful", success_count)
+                st.metric("Successful", stats["success_count"])
             with col3:
-                avg_score = sum([r['analysis'].get('overall_score', 0) for r in db]) / len(db)
-                st.metric("Avg Score", f"{avg_score:.1f}/100")
+                st.metric("Avg Score", f"{stats['avg_score']:.1f}/100")
             with col4:
-                avg_compliance = sum([r['analysis'].get('methodology_compliance', 0) for r in db]) / len(db)
-                st.metric("Avg IL Compliance", f"{avg_compliance:.1f}%")
+                st.metric("Avg IL Compliance", f"{stats['avg_compliance']:.1f}%")
             with col5:
-                unique_rms = len(set([r['rm_name'] for r in db]))
-                st.metric("Active RMs", unique_rms)
+                st.metric("Active RMs", stats["unique_rms"])
         
         # Call Type Performance
         st.markdown("---")
         st.subheader("📊 Performance by Call Type")
-        call_type_stats = {}
-        for r in db:
-            ct = r.get('call_type', 'Unknown')
-            if ct not in call_type_stats:
-                call_type_stats[ct] = {'count': 0, 'scores': []}
-            call_type_stats[ct]['count'] += 1
-            call_type_stats[ct]['scores'].append(r['analysis'].get('overall_score', 0))
-        
-        ct_df = pd.DataFrame([
-            {
-                'Call Type': ct,
-                'Count': data['count'],
-                'Avg Score': f"{sum(data['scores'])/len(data['scores']):.1f}",
-                'Success Rate': f"{(len([s for s in data['scores'] if s >= 70])/len(data['scores'])*100):.0f}%"
-            }
-            for ct, data in call_type_stats.items()
-        ])
         st.dataframe(ct_df, use_container_width=True, hide_index=True)
         
         # Bulk operations
@@ -2100,286 +2970,48 @@ elif page == "Admin View":
                     st.rerun()
         
         with col2:
-            all_data = json.dumps(db, indent=2)
             st.download_button(
                 label="📥 Backup All Data (JSON)",
-                data=all_data,
+                data=partial(_dumps_pretty, db),
                 file_name=f"iron_lady_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json"
             )
         
-        # Filters
-        st.markdown("---")
-        st.subheader("🔍 Advanced Filters")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            rm_list = ["All"] + sorted(list(set([r['rm_name'] for r in db])))
-            selected_rm = st.selectbox("Filter by RM", rm_list)
-        with col2:
-            selected_call_type = st.selectbox("Filter by Call Type", ["All"] + list(CALL_TYPE_FOCUS.keys()))
-        with col3:
-            selected_outcome = st.selectbox("Filter by Outcome", ["All", "Success - Committed", "Partial - Needs Follow-up", "Not Interested", "Rescheduled"])
-        with col4:
-            score_filter = st.selectbox("Score Range", ["All", "Excellent (85-100)", "Good (70-84)", "Average (50-69)", "Needs Work (<50)"])
-        
-        # Apply filters
-        filtered_db = db
-        if selected_rm != "All":
-            filtered_db = [r for r in filtered_db if r['rm_name'] == selected_rm]
-        if selected_call_type != "All":
-            filtered_db = [r for r in filtered_db if r.get('call_type') == selected_call_type]
-        if selected_outcome != "All":
-            filtered_db = [r for r in filtered_db if r['pitch_outcome'] == selected_outcome]
-        if score_filter != "All":
-            if "Excellent" in score_filter:
-                filtered_db = [r for r in filtered_db if r['analysis'].get('overall_score', 0) >= 85]
-            elif "Good" in score_filter:
-                filtered_db = [r for r in filtered_db if 70 <= r['analysis'].get('overall_score', 0) < 85]
-            elif "Average" in score_filter:
-                filtered_db = [r for r in filtered_db if 50 <= r['analysis'].get('overall_score', 0) < 70]
-            elif "Needs Work" in score_filter:
-                filtered_db = [r for r in filtered_db if r['analysis'].get('overall_score', 0) < 50]
-        
-        st.markdown("---")
-        st.subheader(f"📊 Filtered Results ({len(filtered_db)} calls)")
-        
-        # DataFrame
-        df_data = []
-        for record in filtered_db:
-            score = record['analysis'].get('overall_score', 0)
-            status = "🟢" if score >= 80 else "🟡" if score >= 60 else "🔴"
-            df_data.append({
-                "Status": status,
-                "ID": record['id'],
-                "Date": record['call_date'],
-                "RM": record['rm_name'],
-                "Participant": record['client_name'],
-                "Call Type": record.get('call_type', 'N/A'),
-                "Score": f"{score:.1f}",
-                "IL %": f"{record['analysis'].get('methodology_compliance', 0):.1f}%",
-                "Outcome": record['pitch_outcome']
-            })
-        
-        if df_data:
-            df = pd.DataFrame(df_data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
-            
-            # Generate comprehensive CSV export
-            comprehensive_data = []
-            for record in filtered_db:
-                analysis = record.get('analysis', {})
-                core_dims = analysis.get('core_dimensions', {})
-                il_params = analysis.get('iron_lady_parameters', {})
-                
-                # Base record info
-                row = {
-                    "ID": record['id'],
-                    "Date": record['call_date'],
-                    "RM Name": record['rm_name'],
-                    "Participant": record['client_name'],
-                    "Call Type": record.get('call_type', 'N/A'),
-                    "Duration (min)": record.get('call_duration', 'N/A'),
-                    "Outcome": record['pitch_outcome'],
-                    "Overall Score": f"{analysis.get('overall_score', 0):.1f}",
-                    "IL Compliance %": f"{analysis.get('methodology_compliance', 0):.1f}",
-                    "Effectiveness": analysis.get('call_effectiveness', 'N/A'),
-                    "Prediction": analysis.get('outcome_prediction', {}).get('likely_result', 'N/A').replace('_', ' ').title(),
-                    "Confidence %": analysis.get('outcome_prediction', {}).get('confidence', 0)
-                }
-                
-                # Add core dimensions with percentages
-                weights = {
-                    "rapport_building": 20,
-                    "needs_discovery": 25,
-                    "solution_presentation": 25,
-                    "objection_handling": 15,
-                    "closing_technique": 15
-                }
-                for dim, score in core_dims.items():
-                    max_score = weights.get(dim, 10)
-                    pct = (score / max_score) * 100
-                    row[f"CD: {dim.replace('_', ' ').title()}"] = f"{score}/{max_score}"
-                    row[f"CD: {dim.replace('_', ' ').title()} %"] = f"{pct:.0f}%"
-                
-                # Add IL parameters with percentages and status
-                sorted_il_params = sorted(il_params.items(), key=lambda x: x[1], reverse=True)
-                for param, score in sorted_il_params:
-                    pct = (score / 10) * 100
-                    status = "Excellent" if pct >= 80 else "Good" if pct >= 60 else "Needs Focus"
-                    row[f"IL: {param.replace('_', ' ').title()}"] = f"{score}/10"
-                    row[f"IL: {param.replace('_', ' ').title()} %"] = f"{pct:.0f}%"
-                    row[f"IL: {param.replace('_', ' ').title()} Status"] = status
-                
-                # Add areas needing improvement
-                needs_improvement = []
-                for param, score in sorted_il_params:
-                    if (score / 10 * 100) < 60:
-                        needs_improvement.append(param.replace('_', ' ').title())
-                
-                row["Areas Needing Improvement"] = "; ".join(needs_improvement) if needs_improvement else "None - All parameters good"
-                
-                # Add top 3 strengths
-                strengths = analysis.get('key_insights', {}).get('strengths', [])
-                row["Top Strengths"] = "; ".join(strengths[:3]) if strengths else "N/A"
-                
-                # Add top 3 gaps
-                gaps = analysis.get('key_insights', {}).get('critical_gaps', [])
-                row["Critical Gaps"] = "; ".join(gaps[:3]) if gaps else "N/A"
-                
-                # Add coaching recommendations
-                coaching = analysis.get('iron_lady_specific_coaching', [])
-                row["Coaching Focus"] = "; ".join(coaching[:3]) if coaching else "N/A"
-                
-                comprehensive_data.append(row)
-            
-            comprehensive_df = pd.DataFrame(comprehensive_data)
-            csv = comprehensive_df.to_csv(index=False)
-            
-            st.download_button(
-                label="📥 Download Comprehensive Report (CSV)",
-                data=csv,
-                file_name=f"iron_lady_comprehensive_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                help="Includes all scores, parameters, percentages, and improvement areas"
-            )
-            
-            # Parameter Performance Analysis
-            st.markdown("---")
-            st.subheader("📊 Iron Lady Parameter Performance")
-            
-            param_totals = {}
-            param_counts = {}
-            
-            for record in filtered_db:
-                for param, score in record['analysis'].get('iron_lady_parameters', {}).items():
-                    if param not in param_totals:
-                        param_totals[param] = 0
-                        param_counts[param] = 0
-                    param_totals[param] += score
-                    param_counts[param] += 1
-            
-            param_avg = {param: (param_totals[param] / param_counts[param]) for param in param_totals}
-            
-            if param_avg:
-                param_df = pd.DataFrame([
-                    {
-                        "Parameter": param.replace('_', ' ').title(),
-                        "Avg Score": f"{score:.1f}/10",
-                        "%": f"{(score/10*100):.0f}%",
-                        "Status": "🟢 Excellent" if score >= 8 else "🟡 Good" if score >= 6 else "🔴 Needs Focus"
-                    }
-                    for param, score in sorted(param_avg.items(), key=lambda x: x[1], reverse=True)
-                ])
-                
-                st.dataframe(param_df, use_container_width=True, hide_index=True)
-                st.info("💡 **Team Coaching Focus:** Prioritize 🔴 parameters for immediate training and practice")
-            
-            # Detailed records
-            st.markdown("---")
-            st.subheader("🔍 Detailed Call Records")
-            
-            for admin_idx, record in enumerate(reversed(filtered_db[:15])):  # Show last 15
-                analysis = record.get('analysis', {})
-                score = analysis.get('overall_score', 0)
-                score_emoji = "🟢" if score >= 80 else "🟡" if score >= 60 else "🔴"
-                
-                with st.expander(
-                    f"{score_emoji} [{record['id']}] {record['rm_name']} - {record['call_type']} - "
-                    f"{record['client_name']} ({record['call_date']}) - Score: {score:.1f}/100"
-                ):
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.write("**Call Information:**")
-                        st.write(f"• Record ID: {record['id']}")
-                        st.write(f"• RM: {record['rm_name']}")
-                        st.write(f"• Participant: {record['client_name']}")
-                        st.write(f"• Call Type: {record.get('call_type', 'N/A')}")
-                        st.write(f"• Date: {record['call_date']}")
-                        st.write(f"• Duration: {record.get('call_duration', 'N/A')} minutes")
-                        st.write(f"• Outcome: {record['pitch_outcome']}")
-                        st.write(f"• Storage: {record.get('storage_type', 'local')} (7-day auto-delete)")
-                        st.write(f"• Analysis: S3 JSON (7-day auto-delete)")
-                        st.write(f"• Analysis Mode: {record.get('analysis_mode', 'N/A')}")
-                    
-                    with col2:
-                        st.write("**Performance Scores:**")
-                        st.metric("Overall Score", f"{score:.1f}/100")
-                        st.metric("IL Compliance", f"{analysis.get('methodology_compliance', 0):.1f}%")
-                        st.metric("Effectiveness", analysis.get('call_effectiveness', 'N/A'))
-                        pred = analysis.get('outcome_prediction', {})
-                        st.write(f"**Prediction:** {pred.get('likely_result', 'N/A').replace('_', ' ').title()}")
-                        st.write(f"**Confidence:** {pred.get('confidence', 0)}%")
-                    
-                    st.write(f"**Summary:** {analysis.get('call_summary', 'N/A')}")
-                    
-                    # Show parameter breakdown
-                    if 'core_dimensions' in analysis:
-                        st.markdown("**Core Dimensions:**")
-                        for dim, score in analysis['core_dimensions'].items():
-                            max_score = IRON_LADY_PARAMETERS["Core Quality Dimensions"][dim]["weight"]
-                            pct = (score / max_score) * 100
-                            emoji = "🟢" if pct >= 80 else "🟡" if pct >= 60 else "🔴"
-                            st.write(f"{emoji} {dim.replace('_', ' ').title()}: {score}/{max_score} ({pct:.0f}%)")
-                    
-                    if 'iron_lady_parameters' in analysis:
-                        st.markdown("**Iron Lady Parameters:**")
-                        for param, score in analysis['iron_lady_parameters'].items():
-                            pct = (score / 10) * 100
-                            emoji = "🟢" if pct >= 80 else "🟡" if pct >= 60 else "🔴"
-                            st.write(f"{emoji} {param.replace('_', ' ').title()}: {score}/10 ({pct:.0f}%)")
-                    
-                    # Show top 3 strengths and gaps
-                    insights = analysis.get('key_insights', {})
-                    col_a, col_b = st.columns(2)
-                    
-                    with col_a:
-                        if insights.get('strengths'):
-                            st.markdown("**Top Strengths:**")
-                            for s in insights['strengths'][:3]:
-                                st.write(f"✓ {s}")
-                    
-                    with col_b:
-                        if insights.get('critical_gaps'):
-                            st.markdown("**Critical Gaps:**")
-                            for g in insights['critical_gaps'][:3]:
-                                st.write(f"✗ {g}")
-                    
-                    # Coaching recommendations
-                    if 'iron_lady_specific_coaching' in analysis:
-                        st.markdown("**Iron Lady Coaching:**")
-                        for i, rec in enumerate(analysis['iron_lady_specific_coaching'][:3], 1):
-                            st.write(f"{i}. 💎 {rec}")
-                    
-                    # Action buttons
-                    col_a, col_b, col_c, col_d = st.columns([1, 1, 1, 2])
-                    
-                    with col_a:
-                        if st.button("🗑️ Delete", key=f"del_admin_{record['id']}_{admin_idx}"):
-                            delete_record(record['id'])
-                            st.success("Deleted!")
-                            st.rerun()
+        # Re-analysis - records saved with fallback scores after a GPT error
+        failed = [r for r in db if r.get('additional_context') and analysis_failed(r.get('analysis', {}))]
+        # Result of the last click - shown after the st.rerun() that refreshes the records
+        reanalysis_message = st.session_state.pop("reanalysis_message", None)
+        if reanalysis_message:
+            st.success(reanalysis_message)
+        if failed:
+            st.warning(f"⚠️ {len(failed)} call(s) were saved with fallback scores after a GPT error")
+            if st.button(f"🔁 Re-analyze failed calls (up to {GPT_BULK_LIMIT})"):
+                batch = failed[:min(GPT_BULK_LIMIT, gpt_submits_left("gpt_bulk_times", GPT_BULK_RATE_LIMIT))]
+                if not batch:
+                    st.error(f"❌ Rate limit: at most {GPT_BULK_RATE_LIMIT} re-analyses every {GPT_RATE_WINDOW // 60} minutes. Please wait before trying again.")
+                else:
+                    record_gpt_submit("gpt_bulk_times", len(batch))
+                    with st.spinner("🤖 Re-analyzing calls..."):
+                        results = reanalyze_records(batch)
+                    updated = {_record_identity(r): analysis for r, analysis in zip(batch, results) if analysis is not None}
                     
-                    with col_b:
-                        summary = generate_summary_report(record)
-                        st.download_button(
-                            label="📄 Report",
-                            data=summary,
-                            file_name=f"Iron_Lady_Report_{record['id']}.txt",
-                            mime="text/plain",
-                            key=f"sum_adm_{record['id']}_{admin_idx}"
-                        )
+                    def apply_reanalysis(records):
+                        # Patched against the file as it is now - it may have changed during the GPT calls
+                        return [
+                            {**r, 'analysis': updated[_record_identity(r)]}
+                            if _record_identity(r) in updated and analysis_failed(r.get('analysis', {})) else r
+                            for r in records
+                        ]
                     
-                    with col_c:
-                        json_data = json.dumps(record, indent=2)
-                        st.download_button(
-                            label="📥 JSON",
-                            data=json_data,
-                            file_name=f"record_{record['id']}.json",
-                            mime="application/json",
-                            key=f"json_adm_{record['id']}_{admin_idx}"
-                        )
+                    if updated:
+                        update_db(apply_reanalysis)
+                        still_failed = len(batch) - len(updated)
+                        st.session_state["reanalysis_message"] = f"✅ Re-analyzed {len(updated)} call(s)" + (f" - {still_failed} failed again" if still_failed else "")
+                        st.rerun()
+                    else:
+                        st.error("❌ Re-analysis failed - please try again later")
+        
+        render_admin_filtered_records(db, df_all, db_version)
     
     # TAB 2: S3 Analysis JSONs
     with tab_s3_analysis:
@@ -2429,7 +3061,7 @@ elif page == "Admin View":
             # Pagination settings
             analysis_items_per_page = st.selectbox(
                 "📄 Items per page:",
-                options=[10, 25, 50, 100, 200, "All"],
+                options=ITEMS_PER_PAGE_OPTIONS,
                 index=2,  # Default to 50
                 key="analysis_items_per_page"
             )
@@ -2490,7 +3122,7 @@ elif page == "Admin View":
                             
                             if analysis_data:
                                 st.success("✅ Downloaded!")
-                                json_str = json.dumps(analysis_data, indent=2)
+                                json_str = _dumps_pretty(analysis_data)
                                 st.download_button(
                                     label="💾 Save JSON",
                                     data=json_str,
@@ -2533,13 +3165,11 @@ elif page == "Admin View":
                                 col_score1, col_score2 = st.columns(2)
                                 with col_score1:
                                     st.markdown("**🎯 Core Dimensions**")
-                                    for param, score in core.items():
-                                        st.write(f"• {param.replace('_', ' ').title()}: {score}")
+                                    st.dataframe(build_score_table(CORE_DISPLAY_BASE, CORE_KEYS, core), hide_index=True, column_config=SCORE_TABLE_COLUMNS)
                                 
                                 with col_score2:
                                     st.markdown("**💎 Iron Lady Parameters**")
-                                    for param, score in iron_lady.items():
-                                        st.write(f"• {param.replace('_', ' ').title()}: {score}")
+                                    st.dataframe(build_score_table(IL_DISPLAY_BASE, IL_KEYS, iron_lady), hide_index=True, column_config=SCORE_TABLE_COLUMNS)
                             
                             if analysis_results.get('strengths'):
                                 with st.expander("✅ Strengths"):
@@ -2582,7 +3212,7 @@ elif page == "Admin View":
             # Pagination settings
             items_per_page = st.selectbox(
                 "📄 Items per page:",
-                options=[10, 25, 50, 100, 200, "All"],
+                options=ITEMS_PER_PAGE_OPTIONS,
                 index=2,  # Default to 50
                 key="s3_items_per_page"
             )
@@ -2956,6 +3586,15 @@ Be specific about:
             st.caption(f"💡 Use pagination above to navigate through all {len(recordings)} recordings")
             st.caption("🎵 Click 'Play Audio' to listen to any recording in the app")
 
+# Only the selected page's function runs on a rerun
+page = st.navigation([
+    st.Page(upload_page, title="Upload & Analyze", url_path="upload", default=True),
+    st.Page(dashboard_page, title="Dashboard", url_path="dashboard"),
+    st.Page(admin_page, title="Admin View", url_path="admin"),
+    st.Page(parameters_guide_page, title="Parameters Guide", url_path="guide"),
+])
+page.run()
+
 # Footer
 st.sidebar.markdown("---")
 st.sidebar.info("💡 **Tip:** AI is trained on Iron Lady methodology. Mention principles by name and use case study names for accurate scoring!")
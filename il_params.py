@@ -0,0 +1,86 @@
+"""Iron Lady scoring schema - imported by app.py so it is built once per process, not on every rerun"""
+from functools import lru_cache
+from operator import itemgetter
+
+import numpy as np
+
+# Iron Lady Parameters
+IRON_LADY_PARAMETERS = {
+    "Core Quality Dimensions": {
+        "rapport_building": {"weight": 20, "description": "Greetings, warmth, empathy, personalization, relatedness"},
+        "needs_discovery": {"weight": 25, "description": "Strategic questions, probing, understanding challenges and BHAG"},
+        "solution_presentation": {"weight": 25, "description": "Program benefits, community value, outcomes, social proof"},
+        "objection_handling": {"weight": 15, "description": "Concern handling with empathy and solutions"},
+        "closing_technique": {"weight": 15, "description": "Powerful invite, next steps, commitment getting"}
+    },
+    "Iron Lady Specific Parameters": {
+        "profile_understanding": {"weight": 10, "description": "Understanding experience, role, challenges, goals"},
+        "credibility_building": {"weight": 10, "description": "Iron Lady community, success stories, mentors, certification"},
+        "principles_usage": {"weight": 10, "description": "27 Principles framework (Unpredictable Behaviour, 10000 Hours, Differentiate Branding, Shameless Pitching, Art of Negotiation, Contextualisation)"},
+        "case_studies_usage": {"weight": 10, "description": "Success stories from participants (Neha, Rashmi, Chandana, Annapurna, Pushpalatha, Tejaswini)"},
+        "gap_creation": {"weight": 10, "description": "Highlighting what's missing to achieve BHAG, creating urgency"},
+        "bhag_fine_tuning": {"weight": 10, "description": "Big Hairy Audacious Goal exploration, making them dream bigger"},
+        "urgency_creation": {"weight": 10, "description": "Limited spots, immediate action, cost of inaction"},
+        "commitment_getting": {"weight": 10, "description": "Explicit commitments for attendance, participation, taking calls"},
+        "contextualisation": {"weight": 10, "description": "Personalizing to participant's specific situation and profile"},
+        "excitement_creation": {"weight": 10, "description": "Creating enthusiasm about transformation journey"}
+    }
+}
+
+@lru_cache(maxsize=128)
+def _pretty(key):
+    """Display name for a snake_case parameter/result key (tiny fixed domain, so memoized)"""
+    return key.replace('_', ' ').title()
+
+def _tier_emoji(pct):
+    """Traffic-light marker for a 0-100 value: 🟢 >= 80, 🟡 >= 60, 🔴 below"""
+    if pct >= 80:
+        return "🟢"
+    elif pct >= 60:
+        return "🟡"
+    return "🔴"
+
+# Flat weight lookups (avoid walking the nested dict per parameter)
+CORE_WEIGHTS = {k: d["weight"] for k, d in IRON_LADY_PARAMETERS["Core Quality Dimensions"].items()}
+IL_WEIGHTS = {k: d["weight"] for k, d in IRON_LADY_PARAMETERS["Iron Lady Specific Parameters"].items()}
+
+# Fixed parameter order + max-score vectors for array-based scoring
+CORE_KEYS = tuple(CORE_WEIGHTS)
+IL_KEYS = tuple(IL_WEIGHTS)
+CORE_MAX = np.array([CORE_WEIGHTS[k] for k in CORE_KEYS], dtype=np.float64)
+IL_MAX = np.array([IL_WEIGHTS[k] for k in IL_KEYS], dtype=np.float64)
+ALL_KEYS = CORE_KEYS + IL_KEYS
+_CORE_GET = itemgetter(*CORE_KEYS)
+_IL_GET = itemgetter(*IL_KEYS)
+ALL_WEIGHTS = {**CORE_WEIGHTS, **IL_WEIGHTS}
+# Descriptions in the same positional order as the keys
+CORE_DESCRIPTIONS = tuple(IRON_LADY_PARAMETERS["Core Quality Dimensions"][k]["description"] for k in CORE_KEYS)
+IL_DESCRIPTIONS = tuple(IRON_LADY_PARAMETERS["Iron Lady Specific Parameters"][k]["description"] for k in IL_KEYS)
+
+# Fallback score per parameter when GPT omits it (same order as the parameter keys)
+CORE_DEFAULTS = dict(zip(CORE_KEYS, (10, 12, 12, 8, 8)))
+IL_DEFAULTS = dict.fromkeys(IL_KEYS, 5)
+
+CALL_TYPE_FOCUS = {
+    "Welcome Call": ("rapport_building", "profile_understanding", "credibility_building", "principles_usage", "case_studies_usage", "gap_creation", "bhag_fine_tuning", "commitment_getting", "urgency_creation", "contextualisation", "excitement_creation"),
+    "BHAG Call": ("bhag_fine_tuning", "gap_creation", "case_studies_usage", "commitment_getting", "principles_usage", "urgency_creation", "closing_technique"),
+    "Registration Call": ("urgency_creation", "objection_handling", "commitment_getting", "solution_presentation", "credibility_building", "closing_technique"),
+    "30 Sec Pitch": ("profile_understanding", "gap_creation", "case_studies_usage", "urgency_creation", "commitment_getting", "excitement_creation"),
+    "Second Level Call": ("credibility_building", "objection_handling", "solution_presentation", "case_studies_usage", "commitment_getting"),
+    "Follow Up Call": ("commitment_getting", "objection_handling", "urgency_creation", "case_studies_usage", "closing_technique")
+}
+
+# Selectbox options, built once (widgets get the same tuple every rerun)
+CALL_TYPES = tuple(CALL_TYPE_FOCUS)
+CALL_TYPE_FILTER_OPTIONS = ("All",) + CALL_TYPES
+PITCH_OUTCOMES = ("Success - Committed", "Partial - Needs Follow-up", "Not Interested", "Rescheduled")
+OUTCOME_FILTER_OPTIONS = ("All",) + PITCH_OUTCOMES
+
+# Display strings per call type, built once instead of on every rerun
+CALL_TYPE_FOCUS_DISPLAY = {ct: tuple(_pretty(p) for p in params) for ct, params in CALL_TYPE_FOCUS.items()}
+CALL_TYPE_FOCUS_TOP5 = {ct: " • ".join(names[:5]) for ct, names in CALL_TYPE_FOCUS_DISPLAY.items()}
+CALL_TYPE_FOCUS_BULLETS = {ct: "  \n".join(f"• {name}" for name in names) for ct, names in CALL_TYPE_FOCUS_DISPLAY.items()}
+
+# Parameters Guide expanders as (label, description line) pairs
+CORE_GUIDE_ENTRIES = tuple((f"**{_pretty(k)}** ({CORE_WEIGHTS[k]} pts)", f"**Description:** {d}") for k, d in zip(CORE_KEYS, CORE_DESCRIPTIONS))
+IL_GUIDE_ENTRIES = tuple((f"**{_pretty(k)}** ({IL_WEIGHTS[k]} pts)", f"**Description:** {d}") for k, d in zip(IL_KEYS, IL_DESCRIPTIONS))